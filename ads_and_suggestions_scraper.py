@@ -62,6 +62,7 @@
 ############################################################################
 
 import json, csv, time, re, sys, unicodedata, os
+import orjson
 from pathlib import Path
 from datetime import datetime
 from typing   import List, Dict, Tuple, Any
@@ -467,11 +468,8 @@ def save_data_immediately(pair_object: dict, mode: str) -> None:
 
         existing.append(pair_object)
 
-        # Ensure the data is saved with UTF-8 encoding
-        out_file.write_text(
-            json.dumps(existing, indent=2, ensure_ascii=False),
-            encoding="utf-8"
-        )
+        # orjson writes UTF-8 bytes directly - the whole file is rewritten per pair
+        out_file.write_bytes(orjson.dumps(existing, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         print(f"[INFO] Data saved immediately to {out_file}")
         print(f"[INFO] Total records in file: {len(existing)}")
 
@@ -486,10 +484,7 @@ def save_data_immediately(pair_object: dict, mode: str) -> None:
                 backup_file = out_file.parent / f"backup_{out_file.name}"
             else:
                 backup_file = OUTPUT_DIR / f"backup_{mode}.json"
-            backup_file.write_text(
-                json.dumps([pair_object], indent=2, ensure_ascii=False),
-                encoding="utf-8"
-            )
+            backup_file.write_bytes(orjson.dumps([pair_object], option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             print(f"[INFO] Data saved to backup file: {backup_file}")
         except Exception as backup_error:
             print(f"[ERROR] Failed to save backup file: {backup_error}")
@@ -90,6 +90,7 @@ if sys.platform == "win32":
 ############################################################################
 
 import json, csv, time, re, sys, unicodedata, os
+import orjson
 from pathlib import Path
 from datetime import datetime
 from typing   import List, Dict, Tuple, Any
@@ -140,6 +141,7 @@ TARGET_PAIRS: list[tuple[str, str]] = [
 
 # Also update the CONTINUATION setting
 CONTINUATION = os.getenv("CONTINUATION", "True").lower() == "true"  # set False to start fresh
+OUTPUT_FILE  = os.getenv("OUTPUT_FILE") or None                      # exact output path chosen by the caller (API)
 
 # ── CONSTANTS ─────────────────────────────────────────────────────────────
 AD_LIBRARY_URL = (
@@ -439,7 +441,9 @@ def wait_click(sb: SB, selector: str, *, by="css selector", timeout=10):
 
 
 def next_output_path(mode: str) -> Path:
-    """Return output file path based on APPEND setting"""
+    """Return output file path based on OUTPUT_FILE / APPEND setting"""
+    if OUTPUT_FILE:
+        return Path(OUTPUT_FILE)
     if APPEND:
         return OUTPUT_DIR / f"{mode}.json"
     counter = 1
@@ -454,7 +458,8 @@ def save_data_immediately(pair_object: dict, mode: str) -> None:
     out_file = None
     try:
         out_file = next_output_path(mode)
-        if out_file.exists() and APPEND:
+        # A caller-chosen OUTPUT_FILE collects every pair of this run
+        if out_file.exists() and (APPEND or OUTPUT_FILE):
             try:
                 existing = json.loads(out_file.read_text(encoding="utf-8"))
                 if not isinstance(existing, list):
@@ -483,11 +488,8 @@ def save_data_immediately(pair_object: dict, mode: str) -> None:
 
         existing.append(pair_object)
 
-        # Ensure the data is saved with UTF-8 encoding
-        out_file.write_text(
-            json.dumps(existing, indent=2, ensure_ascii=False),
-            encoding="utf-8"
-        )
+        # orjson writes UTF-8 bytes directly - the whole file is rewritten per pair
+        out_file.write_bytes(orjson.dumps(existing, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         print(f"[INFO] Data saved immediately to {out_file}")
         print(f"[INFO] Total records in file: {len(existing)}")
 
@@ -502,10 +504,7 @@ def save_data_immediately(pair_object: dict, mode: str) -> None:
                 backup_file = out_file.parent / f"backup_{out_file.name}"
             else:
                 backup_file = OUTPUT_DIR / f"backup_{mode}.json"
-            backup_file.write_text(
-                json.dumps([pair_object], indent=2, ensure_ascii=False),
-                encoding="utf-8"
-            )
+            backup_file.write_bytes(orjson.dumps([pair_object], option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             print(f"[INFO] Data saved to backup file: {backup_file}")
         except Exception as backup_error:
             print(f"[ERROR] Failed to save backup file: {backup_error}")
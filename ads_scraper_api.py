@@ -145,27 +145,34 @@ class AdsScraperAPI:
         all_links = []
         image_urls = []
 
-        for element in card.find_elements("xpath", ".//*[self::a or self::img]"):
-            try:
-                if element.tag_name == "a":
-                    href = element.get_attribute("href")
-                    if href:
-                        parsed = urlparse(href)
-                        if parsed.netloc.replace("www.", "") not in facebook_domains:
-                            all_links.append({
-                                "type": "link",
-                                "url": href,
-                                "text": element.text.strip() if element.text else ""
-                            })
-
-                elif element.tag_name == "img":
-                    for attr in ["src", "data-src", "xlink:href"]:
-                        src = element.get_attribute(attr)
-                        if src and src.startswith(("http:", "https:")):
-                            image_urls.append(src)
-                            break
-            except:
-                continue
+        # Anchors and images in two lookups, then every attribute in one script
+        anchors = card.find_elements("xpath", ".//a[@href]")
+        imgs = card.find_elements("xpath", ".//img")
+        try:
+            data = card.parent.execute_script(
+                "return {a: [...arguments[0]].map(a => [a.href, a.innerText]),"
+                " i: [...arguments[1]].map(i => [i.src, i.getAttribute('data-src'),"
+                " i.getAttribute('xlink:href')])};",
+                anchors, imgs,
+            )
+        except Exception:
+            data = {"a": [], "i": []}
+
+        for href, text in data.get("a", []):
+            if href:
+                parsed = urlparse(href)
+                if parsed.netloc.replace("www.", "") not in facebook_domains:
+                    all_links.append({
+                        "type": "link",
+                        "url": href,
+                        "text": text.strip() if text else ""
+                    })
+
+        for candidates in data.get("i", []):
+            for src in candidates:
+                if src and src.startswith(("http:", "https:")):
+                    image_urls.append(src)
+                    break
 
         return {
             "status": status,
@@ -13,7 +13,9 @@ import subprocess
 import os
 import sys
 import re
+from collections import deque
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pydantic import BaseModel, Field, validator
 from typing import Optional, List, Dict, Any, Literal
 from pathlib import Path
@@ -87,6 +89,23 @@ app.add_middleware(
 RESULTS_DIR = Path("Results")
 RESULTS_DIR.mkdir(exist_ok=True)
 
+@lru_cache(maxsize=16)
+def _parse_results_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a Results JSON / JSON Lines file; mtime and size key the cache so rewrites are re-read"""
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.endswith(".jsonl"):
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
+
+def load_results_file(file_path: Path) -> tuple:
+    """
+    Return (parsed data, stat) for a Results file, parsing it only when it changed.
+
+    The parsed data is shared between requests - treat it as read-only.
+    """
+    st = file_path.stat()
+    return _parse_results_file(str(file_path), st.st_mtime_ns, st.st_size), st
+
 # Pydantic models for request bodies
 class AdsScrapingRequest(BaseModel):
     headless: bool = Field(default=True, description="Run browser in headless mode")
@@ -366,30 +385,40 @@ class DataResponse(BaseModel):
 
 # Job tracking
 active_jobs = {}
+JOB_FINAL_STATUSES = {"completed", "failed"}
+JOB_WAIT_MAX_SECONDS = 60  # upper bound for GET /jobs/{job_id}?wait=...
+JOB_WAIT_POLL_INTERVAL = 0.25  # in-process check, no HTTP round trip
 
 def generate_job_id() -> str:
     """Generate unique job ID"""
     return f"job_{int(time.time())}_{hash(str(time.time())) % 10000}"
 
-# Request tracking for rate limiting
-request_tracker = {}
+# Request tracking for rate limiting: per-IP request times, oldest first
+request_tracker: Dict[str, deque] = {}
+_RATE_LIMIT_SWEEP_INTERVAL = 60  # seconds between purges of idle IPs
+_last_rate_limit_sweep = time.time()
 
 def rate_limit_check(client_ip: str, limit: int = 1000, window: int = 60) -> bool:
-    """Simple rate limiting implementation"""
+    """Simple sliding-window rate limiting implementation"""
+    global _last_rate_limit_sweep
     now = time.time()
-    if client_ip not in request_tracker:
-        request_tracker[client_ip] = []
 
-    # Clean old requests
-    request_tracker[client_ip] = [
-        req_time for req_time in request_tracker[client_ip]
-        if now - req_time < window
-    ]
+    # Forget clients that have been idle for a whole window
+    if now - _last_rate_limit_sweep >= _RATE_LIMIT_SWEEP_INTERVAL:
+        for ip in [ip for ip, hits in request_tracker.items() if not hits or now - hits[-1] >= window]:
+            del request_tracker[ip]
+        _last_rate_limit_sweep = now
 
-    if len(request_tracker[client_ip]) >= limit:
+    hits = request_tracker.setdefault(client_ip, deque())
+
+    # Clean old requests - they are in order, so only the expired head is touched
+    while hits and now - hits[0] >= window:
+        hits.popleft()
+
+    if len(hits) >= limit:
         return False
 
-    request_tracker[client_ip].append(now)
+    hits.append(now)
     return True
 
 @app.middleware("http")
@@ -483,6 +512,9 @@ def run_ads_scraper(job_id: str, request_data: AdsScrapingRequest):
     try:
         active_jobs[job_id] = {"status": "running", "type": "ads", "started_at": datetime.now().isoformat()}
 
+        # Append mode keeps collecting into ads.json, otherwise each job gets its own file
+        output_file = RESULTS_DIR / ("ads.json" if request_data.append_mode else f"ads_{job_id}.json")
+
         # Create environment variables for all parameters
         env = dict(os.environ)
         env.update({
@@ -502,7 +534,8 @@ def run_ads_scraper(job_id: str, request_data: AdsScrapingRequest):
             "ADVERTISERS": json.dumps(request_data.advertisers, ensure_ascii=False),
             "CONTINUATION": str(request_data.continuation),
             "SCRAPE_ADVERTISER_ADS": "False",  # For ads mode, we don't need advertiser ads
-            "ADVERTISER_ADS_LIMIT": "100"  # Default value
+            "ADVERTISER_ADS_LIMIT": "100",  # Default value
+            "OUTPUT_FILE": str(output_file),  # Known up front - no glob over Results/ afterwards
         })
 
         # Create command to run the scraper
@@ -556,9 +589,8 @@ def run_ads_scraper(job_id: str, request_data: AdsScrapingRequest):
         active_jobs[job_id]["completed_at"] = datetime.now().isoformat()
         if stdout_text:
             active_jobs[job_id]["output"] = stdout_text
-        output_files = list(RESULTS_DIR.glob("ads*.json"))
-        if output_files:
-            active_jobs[job_id]["output_files"] = [str(f) for f in output_files]
+        if output_file.exists():
+            active_jobs[job_id]["output_files"] = [str(output_file)]
     elif process:
         active_jobs[job_id]["status"] = "failed"
         active_jobs[job_id]["error"] = stderr_text if stderr_text else "Process failed with no error output"
@@ -591,7 +623,7 @@ def run_advertiser_scraper(job_id: str, request_data: AdvertiserScrapingRequest)
         # Save temporary config
         temp_config_path = f"temp_advertiser_config_{job_id}.json"
         with open(temp_config_path, 'w', encoding='utf-8') as f:
-            json.dump(temp_config, f, ensure_ascii=False, indent=2)
+            json.dump(temp_config, f, ensure_ascii=False)  # machine-read and deleted after the run
 
         # Set environment variables
         env = {
@@ -693,7 +725,7 @@ def run_pages_scraper(job_id: str, request_data: PageScrapingRequest):
             temp_config["URLS"] = request_data.urls        # Save temporary config
         temp_config_path = f"temp_pages_config_{job_id}.json"
         with open(temp_config_path, 'w', encoding='utf-8') as f:
-            json.dump(temp_config, f, ensure_ascii=False, indent=2)
+            json.dump(temp_config, f, ensure_ascii=False)  # machine-read and deleted after the run
 
         # Set environment variables
         env = {
@@ -759,6 +791,17 @@ def run_pages_scraper(job_id: str, request_data: PageScrapingRequest):
         active_jobs[job_id]["status"] = "failed"
         active_jobs[job_id]["error"] = str(e)
 
+# Last successful suggestions result per request, offered when a re-run fails
+_last_good_suggestions: Dict[str, Dict[str, Any]] = {}
+_LAST_GOOD_SUGGESTIONS_MAX = 32
+
+def _suggestions_cache_key(request_data: SuggestionsScrapingRequest) -> str:
+    """Identify a suggestions request by what it scrapes (headless doesn't matter)"""
+    return json.dumps(
+        [request_data.target_pairs, request_data.scrape_advertiser_ads, request_data.advertiser_ads_limit],
+        ensure_ascii=False
+    )
+
 def run_suggestions_scraper(job_id: str, request_data: SuggestionsScrapingRequest):
     """Run suggestions scraper in background"""
     try:
@@ -784,6 +827,16 @@ def run_suggestions_scraper(job_id: str, request_data: SuggestionsScrapingReques
         active_jobs[job_id]["results"] = result
         logger.info(f"Suggestions job {job_id} completed successfully")
 
+        # Remember it (most recent last) as the fallback for this request
+        cache_key = _suggestions_cache_key(request_data)
+        _last_good_suggestions.pop(cache_key, None)
+        _last_good_suggestions[cache_key] = {
+            "results": result,
+            "completed_at": active_jobs[job_id]["completed_at"]
+        }
+        if len(_last_good_suggestions) > _LAST_GOOD_SUGGESTIONS_MAX:
+            _last_good_suggestions.pop(next(iter(_last_good_suggestions)))
+
     except Exception as e:
         error_msg = f"Suggestions job {job_id} failed with exception: {str(e)}"
         logger.error(error_msg)
@@ -794,6 +847,14 @@ def run_suggestions_scraper(job_id: str, request_data: SuggestionsScrapingReques
             "started_at": active_jobs.get(job_id, {}).get("started_at", datetime.now().isoformat())
         }
 
+        # Browser runs fail intermittently - hand back the last good result for
+        # the same request so the client isn't left empty-handed
+        last_good = _last_good_suggestions.get(_suggestions_cache_key(request_data))
+        if last_good:
+            active_jobs[job_id]["stale_results"] = last_good["results"]
+            active_jobs[job_id]["stale_completed_at"] = last_good["completed_at"]
+            logger.info(f"Suggestions job {job_id} - attached last good result from {last_good['completed_at']}")
+
 def run_posts_scraper(job_id: str, request_data: PostsScrapingRequest):
     """Run posts scraper in background"""
     process = None
@@ -1058,59 +1119,58 @@ async def get_ads_data(
         all_data = []
         for file_path in ads_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    file_data = json.load(f)
-                    if isinstance(file_data, list):
-                        # Each item in the list represents a country-keyword pair result
-                        for item in file_data:
-                            if isinstance(item, dict):
-                                # Filter based on keyword (search within country-keyword pairs)
-                                item_keyword = item.get("keyword", "").lower()
-                                if keyword.lower() in item_keyword:
-                                    # Filter ads within this pair
-                                    ads_in_pair = item.get("ads", [])
-                                    filtered_ads = []
-
-                                    for ad in ads_in_pair:
-                                        # Apply filters
-                                        if category != "all" and ad.get("category", "").lower() != category.lower():
-                                            continue
-                                        if location != "thailand" and item.get("country", "").lower() != location.lower():
-                                            continue
-                                        if language != "thai" and not any(lang.lower() == language.lower() for lang in ad.get("languages", [])):
-                                            continue
-                                        if advertiser != "all" and ad.get("page", "").lower() != advertiser.lower():
-                                            continue
-                                        if platform != "all" and not any(plat.lower() == platform.lower() for plat in ad.get("platforms", [])):
-                                            continue
-                                        if media_type != "all" and ad.get("media_type", "").lower() != media_type.lower():
-                                            continue
-                                        if status != "all" and ad.get("status", "").lower() != status.lower():
-                                            continue
-
-                                        # Add to filtered results
-                                        filtered_ads.append(ad)
-
-                                        # Check limit
-                                        if len(all_data) + len(filtered_ads) >= limit:
-                                            break
-
-                                    all_data.extend(filtered_ads)
+                file_data, st = load_results_file(file_path)
+                if isinstance(file_data, list):
+                    # Each item in the list represents a country-keyword pair result
+                    for item in file_data:
+                        if isinstance(item, dict):
+                            # Filter based on keyword (search within country-keyword pairs)
+                            item_keyword = item.get("keyword", "").lower()
+                            if keyword.lower() in item_keyword:
+                                # Filter ads within this pair
+                                ads_in_pair = item.get("ads", [])
+                                filtered_ads = []
+
+                                for ad in ads_in_pair:
+                                    # Apply filters
+                                    if category != "all" and ad.get("category", "").lower() != category.lower():
+                                        continue
+                                    if location != "thailand" and item.get("country", "").lower() != location.lower():
+                                        continue
+                                    if language != "thai" and not any(lang.lower() == language.lower() for lang in ad.get("languages", [])):
+                                        continue
+                                    if advertiser != "all" and ad.get("page", "").lower() != advertiser.lower():
+                                        continue
+                                    if platform != "all" and not any(plat.lower() == platform.lower() for plat in ad.get("platforms", [])):
+                                        continue
+                                    if media_type != "all" and ad.get("media_type", "").lower() != media_type.lower():
+                                        continue
+                                    if status != "all" and ad.get("status", "").lower() != status.lower():
+                                        continue
+
+                                    # Add to filtered results
+                                    filtered_ads.append(ad)
 
                                     # Check limit
-                                    if len(all_data) >= limit:
+                                    if len(all_data) + len(filtered_ads) >= limit:
                                         break
-                            else:
-                                # If it's not a dict, treat it as raw data
-                                all_data.append({"data": item})
-                    else:
-                        # If file_data is not a list, add it as is
-                        all_data.append(file_data if isinstance(file_data, dict) else {"data": file_data})
+
+                                all_data.extend(filtered_ads)
+
+                                # Check limit
+                                if len(all_data) >= limit:
+                                    break
+                        else:
+                            # If it's not a dict, treat it as raw data
+                            all_data.append({"data": item})
+                else:
+                    # If file_data is not a list, add it as is
+                    all_data.append(file_data if isinstance(file_data, dict) else {"data": file_data})
 
                 data_files.append({
                     "file": file_path.name,
-                    "size": file_path.stat().st_size,
-                    "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+                    "size": st.st_size,
+                    "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
                 })
 
                 # Check limit
@@ -1163,16 +1223,15 @@ async def get_advertisers_data_legacy():
         all_data = []
         for file_path in advertiser_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    file_data = json.load(f)
-                    if isinstance(file_data, list):
-                        all_data.extend(file_data)
-                    else:
-                        all_data.append(file_data)
+                file_data, st = load_results_file(file_path)
+                if isinstance(file_data, list):
+                    all_data.extend(file_data)
+                else:
+                    all_data.append(file_data)
                 data_files.append({
                     "file": file_path.name,
-                    "size": file_path.stat().st_size,
-                    "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+                    "size": st.st_size,
+                    "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
                 })
             except Exception as e:
                 logger.error(f"Error reading {file_path}: {e}")
@@ -1199,21 +1258,20 @@ async def get_suggestions_data():
     """
     try:
         data_files = []
-        suggestions_files = list(RESULTS_DIR.glob("suggestions*.json"))
+        suggestions_files = list(RESULTS_DIR.glob("suggestions*.json")) + list(RESULTS_DIR.glob("suggestions*.jsonl"))
 
         all_data = []
         for file_path in suggestions_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    file_data = json.load(f)
-                    if isinstance(file_data, list):
-                        all_data.extend([item if isinstance(item, dict) else {"data": item} for item in file_data])
-                    else:
-                        all_data.append(file_data if isinstance(file_data, dict) else {"data": file_data})
+                file_data, st = load_results_file(file_path)
+                if isinstance(file_data, list):
+                    all_data.extend([item if isinstance(item, dict) else {"data": item} for item in file_data])
+                else:
+                    all_data.append(file_data if isinstance(file_data, dict) else {"data": file_data})
                 data_files.append({
                     "file": file_path.name,
-                    "size": file_path.stat().st_size,
-                    "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+                    "size": st.st_size,
+                    "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
                 })
             except Exception as e:
                 logger.error(f"Error reading {file_path}: {e}")
@@ -1245,16 +1303,15 @@ async def get_pages_data():
         all_data = []
         for file_path in pages_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    file_data = json.load(f)
-                    if isinstance(file_data, list):
-                        all_data.extend([item if isinstance(item, dict) else {"data": item} for item in file_data])
-                    else:
-                        all_data.append(file_data if isinstance(file_data, dict) else {"data": file_data})
+                file_data, st = load_results_file(file_path)
+                if isinstance(file_data, list):
+                    all_data.extend([item if isinstance(item, dict) else {"data": item} for item in file_data])
+                else:
+                    all_data.append(file_data if isinstance(file_data, dict) else {"data": file_data})
                 data_files.append({
                     "file": file_path.name,
-                    "size": file_path.stat().st_size,
-                    "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+                    "size": st.st_size,
+                    "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
                 })
             except Exception as e:
                 logger.error(f"Error reading {file_path}: {e}")
@@ -1323,10 +1380,11 @@ async def get_posts_data(
                             if source_url:
                                 url_to_data[source_url] = file_data
 
+                st = file_path.stat()
                 data_files.append({
                     "file": file_path.name,
-                    "size": file_path.stat().st_size,
-                    "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+                    "size": st.st_size,
+                    "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
                 })
 
             except Exception as e:
@@ -1354,27 +1412,15 @@ async def get_posts_data(
                 # Create the request data for posts scraping
                 scrape_request = PostsScrapingRequest(links=missing_links)
 
-                # Run the scraper synchronously (wait for completion)
-                run_posts_scraper(scrape_job_id, scrape_request)
+                # Run the scraper in a worker thread and wait for it to finish,
+                # keeping the event loop free for other requests meanwhile
+                await asyncio.to_thread(run_posts_scraper, scrape_job_id, scrape_request)
 
-                # Wait for the scraping job to complete (poll the job status)
-                import time
-                max_wait_time = 120  # 2 minutes max wait
-                wait_interval = 2  # Check every 2 seconds
-                elapsed_time = 0
-
-                while elapsed_time < max_wait_time:
-                    if scrape_job_id in active_jobs:
-                        job_status = active_jobs[scrape_job_id].get("status")
-                        if job_status == "completed":
-                            logger.info(f"Scraping job {scrape_job_id} completed successfully")
-                            break
-                        elif job_status == "failed":
-                            logger.error(f"Scraping job {scrape_job_id} failed")
-                            break
-
-                    time.sleep(wait_interval)
-                    elapsed_time += wait_interval
+                job_status = active_jobs.get(scrape_job_id, {}).get("status")
+                if job_status == "completed":
+                    logger.info(f"Scraping job {scrape_job_id} completed successfully")
+                else:
+                    logger.error(f"Scraping job {scrape_job_id} failed")
 
                 # Try to read the newly scraped data
                 new_results_files = list(RESULTS_DIR.glob("results_*.json"))
@@ -1419,13 +1465,14 @@ async def get_posts_data(
         all_data = found_data + scraped_data
 
         # Update data files info to include any new files
-        current_files = list(RESULTS_DIR.glob("results_*.json"))
-        for file_path in current_files:
-            if file_path.name not in [f["file"] for f in data_files]:
+        known_files = {f["file"] for f in data_files}
+        for file_path in RESULTS_DIR.glob("results_*.json"):
+            if file_path.name not in known_files:
+                st = file_path.stat()
                 data_files.append({
                     "file": file_path.name,
-                    "size": file_path.stat().st_size,
-                    "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+                    "size": st.st_size,
+                    "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
                 })
 
         return DataResponse(
@@ -1448,13 +1495,24 @@ async def get_posts_data(
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/jobs/{job_id}")
-async def get_job_status(job_id: str):
+async def get_job_status(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=JOB_WAIT_MAX_SECONDS,
+                        description="Long-poll: seconds to hold the request until the job completes or fails")
+):
     """
     Get status of a specific job
+
+    With ?wait=N the response is held until the job completes or fails (or N
+    seconds pass), so clients see the transition at once without re-polling.
     """
     if job_id not in active_jobs:
         raise HTTPException(status_code=404, detail="Job not found")
 
+    deadline = time.monotonic() + wait
+    while active_jobs[job_id]["status"] not in JOB_FINAL_STATUSES and time.monotonic() < deadline:
+        await asyncio.sleep(JOB_WAIT_POLL_INTERVAL)
+
     return {
         "job_id": job_id,
         "status": active_jobs[job_id]["status"],
@@ -1473,27 +1531,32 @@ async def get_all_jobs():
         "timestamp": datetime.now().isoformat()
     }
 
+# Static part of the /status payload, built once
+_STATUS_INFO = {
+    "api_version": "2.0.0",
+    "status": "operational",
+    "scraping_endpoints": (
+        "POST /scrape/ads",
+        "POST /scrape/advertisers",
+        "POST /scrape/pages",
+        "POST /scrape/suggestions",
+        "POST /scrape/posts"
+    ),
+    "data_endpoints": (
+        "GET /data/ads",
+        "GET /data/advertisers",
+        "GET /data/pages",
+        "GET /data/suggestions",
+        "GET /data/advertiser-ads",
+        "GET /data/posts"
+    ),
+}
+
 @app.get("/status")
 async def get_status():
     """Get API status and statistics"""
     return {
-        "api_version": "2.0.0",
-        "status": "operational",
-        "scraping_endpoints": [
-            "POST /scrape/ads",
-            "POST /scrape/advertisers",
-            "POST /scrape/pages",
-            "POST /scrape/suggestions",
-            "POST /scrape/posts"
-        ],
-        "data_endpoints": [
-            "GET /data/ads",
-            "GET /data/advertisers",
-            "GET /data/pages",
-            "GET /data/suggestions",
-            "GET /data/advertiser-ads",
-            "GET /data/posts"
-        ],
+        **_STATUS_INFO,
         "active_jobs": len(active_jobs),
         "timestamp": datetime.now().isoformat()
     }
@@ -1517,10 +1580,11 @@ async def get_ads_data_legacy():
                         all_data.extend([item if isinstance(item, dict) else {"data": item} for item in file_data])
                     else:
                         all_data.append(file_data if isinstance(file_data, dict) else {"data": file_data})
+                st = file_path.stat()
                 data_files.append({
                     "file": file_path.name,
-                    "size": file_path.stat().st_size,
-                    "modified": datetime.fromtimestamp(file_path.stat().st_mtime).isoformat()
+                    "size": st.st_size,
+                    "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
                 })
             except Exception as e:
                 logger.error(f"Error reading {file_path}: {e}")
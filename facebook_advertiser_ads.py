@@ -550,8 +550,13 @@ def run_advertiser_scraping_logic(sb, pairs, done_pairs):
         sb.open(AD_LIBRARY_URL)
         sb.sleep(4)
 
-    print("\n[DONE] All pairs processed – browser stays open for 3 min.")
-    sb.sleep(180)
+    # Only a visible browser is worth keeping open for inspection; headless
+    # runs (every API job) exit right away instead of idling for 3 minutes
+    if HEADLESS:
+        print("\n[DONE] All pairs processed.")
+    else:
+        print("\n[DONE] All pairs processed – browser stays open for 3 min.")
+        sb.sleep(180)
 
 # ── LOAD CONFIG FROM FILE OR COMMAND LINE ──────────────────────────────────
 def load_config():
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Buffered logging shared by the scraper modules
+"""
+
+import atexit
+import logging
+from logging.handlers import MemoryHandler
+
+class RootForwardHandler(logging.Handler):
+    """Pass flushed records on to the root logger's handlers."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger().handle(record)
+
+def buffer_logger(logger: logging.Logger, capacity: int = 1024) -> MemoryHandler:
+    """
+    Buffer a chatty module logger and write its records in batches.
+
+    Records are held until ``capacity`` is reached, an ERROR is logged or the
+    returned handler is flushed, then passed on to the root logger's handlers.
+    The buffer is also flushed at interpreter exit.
+
+    Args:
+        logger: Module logger to buffer (it stops propagating to the root)
+        capacity: Number of records held before an automatic flush
+
+    Returns:
+        The buffering handler, for explicit flushes at natural boundaries
+    """
+    handler = MemoryHandler(capacity=capacity, flushLevel=logging.ERROR, target=RootForwardHandler())
+    logger.addHandler(handler)
+    logger.propagate = False
+    atexit.register(handler.flush)
+    return handler
@@ -10,11 +10,27 @@ import time
 from pathlib import Path
 from typing import Dict, Any, List
 from datetime import datetime
+from functools import lru_cache
 from urllib.parse import urlparse, parse_qs
 
 from seleniumbase import SB
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
+@lru_cache(maxsize=1024)
+def _normalize_facebook_url(url: str) -> str:
+    """Normalize Facebook URL to handle different formats (pure, so cached per URL)"""
+    if not url.startswith(('http://', 'https://')):
+        url = 'https://' + url
+
+    # Handle profile.php URLs
+    parsed = urlparse(url)
+    if 'profile.php' in parsed.path:
+        query_params = parse_qs(parsed.query)
+        if 'id' in query_params:
+            return f"https://www.facebook.com/profile.php?id={query_params['id'][0]}"
+
+    return url
+
 class PageScraperAPI:
     """API wrapper for Facebook page scraping functionality"""
 
@@ -291,17 +307,7 @@ class PageScraperAPI:
 
     def normalize_facebook_url(self, url: str) -> str:
         """Normalize Facebook URL to handle different formats"""
-        if not url.startswith(('http://', 'https://')):
-            url = 'https://' + url
-
-        # Handle profile.php URLs
-        parsed = urlparse(url)
-        if 'profile.php' in parsed.path:
-            query_params = parse_qs(parsed.query)
-            if 'id' in query_params:
-                return f"https://www.facebook.com/profile.php?id={query_params['id'][0]}"
-
-        return url
+        return _normalize_facebook_url(url)
 
     async def extract_page(self, url: str, extract_posts: bool = True, post_limit: int = 100) -> Dict[str, Any]:
         """
@@ -245,10 +245,11 @@ class PostScraperAPI:
         """Extract post ID from Facebook URL"""
         try:
             # Handle different URL formats
+            # partition stops at the first separator instead of splitting the whole URL
             if "/posts/" in url:
-                post_id = url.split("/posts/")[1].split("/")[0].split("?")[0]
+                post_id = url.partition("/posts/")[2].partition("/")[0].partition("?")[0]
             elif "/share/p/" in url:
-                post_id = url.split("/share/p/")[1].split("/")[0].split("?")[0]
+                post_id = url.partition("/share/p/")[2].partition("/")[0].partition("?")[0]
             elif "story_fbid=" in url:
                 parsed = urlparse(url)
                 query_params = parse_qs(parsed.query)
@@ -266,8 +267,7 @@ class PostScraperAPI:
             url = 'https://' + url
 
         # Remove tracking parameters
-        if "?" in url:
-            url = url.split("?")[0]
+        url = url.partition("?")[0]
 
         return url
 
@@ -5,12 +5,15 @@ Facebook Proxy Connectivity Diagnostic Tool
 This script helps diagnose proxy connectivity issues when getting ERR_EMPTY_RESPONSE from Facebook.
 """
 
+import atexit
 import json
 import logging
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from pathlib import Path
-from proxy_utils_enhanced import load_proxies, test_proxy_connection, create_proxy_health_report
+from proxy_utils_enhanced import load_proxies, test_proxy_connection, create_proxy_health_report, proxy_config
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +26,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# One keep-alive session for every probe: repeat requests to the same host
+# (or through the same proxy) reuse the pooled connection instead of a new
+# TCP + TLS handshake. No retries - diagnostics must report raw failures.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+atexit.register(_SESSION.close)
+
+MAX_PARALLEL_PROXIES = 16  # proxies probed at the same time
+
 def test_direct_facebook_access():
     """Test if Facebook is accessible without proxy."""
     print("\n" + "="*60)
@@ -36,15 +50,22 @@ def test_direct_facebook_access():
         'https://www.facebook.com/robots.txt'
     ]
 
-    for url in test_urls:
-        try:
-            print(f"\nTesting: {url}")
-            response = requests.get(url, timeout=10, allow_redirects=False)
-            print(f"✅ Status: {response.status_code}")
-            print(f"   Headers: {dict(list(response.headers.items())[:3])}")
+    # DNS lookup + connect for every URL at once; output keeps the list order
+    with ThreadPoolExecutor(max_workers=len(test_urls)) as executor:
+        for lines in executor.map(_check_direct_url, test_urls):
+            print("\n".join(lines))
 
-        except Exception as e:
-            print(f"❌ Failed: {e}")
+def _check_direct_url(url):
+    """Fetch one URL without a proxy and return the report lines."""
+    lines = [f"\nTesting: {url}"]
+    try:
+        response = _SESSION.get(url, timeout=10, allow_redirects=False)
+        lines.append(f"✅ Status: {response.status_code}")
+        lines.append(f"   Headers: {dict(list(response.headers.items())[:3])}")
+
+    except Exception as e:
+        lines.append(f"❌ Failed: {e}")
+    return lines
 
 def test_proxy_facebook_access():
     """Test Facebook access through each proxy."""
@@ -63,42 +84,46 @@ def test_proxy_facebook_access():
         'http://www.facebook.com'  # Try HTTP instead of HTTPS
     ]
 
-    for i, proxy_tuple in enumerate(proxies, 1):
-        host, port, username, password = proxy_tuple
-        print(f"\n--- PROXY {i}: {username}@{host}:{port} ---")
+    # Every proxy is its own IP, so they are probed side by side instead of
+    # one after another with a pause; output keeps the proxies.json order
+    with ThreadPoolExecutor(max_workers=min(len(proxies), MAX_PARALLEL_PROXIES)) as executor:
+        reports = executor.map(_probe_proxy_facebook, range(1, len(proxies) + 1),
+                               proxies, [facebook_urls] * len(proxies))
+        for lines in reports:
+            print("\n".join(lines))
 
-        proxy_url = f"http://{username}:{password}@{host}:{port}"
-        proxy_config = {
-            'http': proxy_url,
-            'https': proxy_url
-        }
+def _probe_proxy_facebook(i, proxy_tuple, facebook_urls):
+    """Fetch the Facebook URLs through one proxy and return the report lines."""
+    host, port, username, password = proxy_tuple
+    lines = [f"\n--- PROXY {i}: {username}@{host}:{port} ---"]
 
-        for url in facebook_urls:
-            try:
-                print(f"Testing {url}")
-                response = requests.get(
-                    url,
-                    proxies=proxy_config,
-                    timeout=15,
-                    allow_redirects=False,
-                    headers={
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-                    }
-                )
-                print(f"✅ Status: {response.status_code}")
-                if response.status_code == 200:
-                    print(f"   Content length: {len(response.content)} bytes")
-
-            except requests.exceptions.ProxyError as e:
-                print(f"❌ Proxy Error: {e}")
-            except requests.exceptions.ConnectTimeout as e:
-                print(f"❌ Connection Timeout: {e}")
-            except requests.exceptions.ConnectionError as e:
-                print(f"❌ Connection Error: {e}")
-            except Exception as e:
-                print(f"❌ Other Error: {e}")
+    proxies = proxy_config(proxy_tuple)
 
-        time.sleep(2)  # Delay between proxy tests
+    for url in facebook_urls:
+        try:
+            lines.append(f"Testing {url}")
+            response = _SESSION.get(
+                url,
+                proxies=proxies,
+                timeout=15,
+                allow_redirects=False,
+                headers={
+                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+                }
+            )
+            lines.append(f"✅ Status: {response.status_code}")
+            if response.status_code == 200:
+                lines.append(f"   Content length: {len(response.content)} bytes")
+
+        except requests.exceptions.ProxyError as e:
+            lines.append(f"❌ Proxy Error: {e}")
+        except requests.exceptions.ConnectTimeout as e:
+            lines.append(f"❌ Connection Timeout: {e}")
+        except requests.exceptions.ConnectionError as e:
+            lines.append(f"❌ Connection Error: {e}")
+        except Exception as e:
+            lines.append(f"❌ Other Error: {e}")
+    return lines
 
 def test_proxy_basic_connectivity():
     """Test basic proxy connectivity to non-Facebook sites."""
@@ -118,39 +143,45 @@ def test_proxy_basic_connectivity():
         'http://www.example.com'
     ]
 
-    for i, proxy_tuple in enumerate(proxies, 1):
-        host, port, username, password = proxy_tuple
-        print(f"\n--- PROXY {i}: {username}@{host}:{port} ---")
+    with ThreadPoolExecutor(max_workers=min(len(proxies), MAX_PARALLEL_PROXIES)) as executor:
+        reports = executor.map(_probe_proxy_basic, range(1, len(proxies) + 1),
+                               proxies, [test_sites] * len(proxies))
+        for lines in reports:
+            print("\n".join(lines))
 
-        working_sites = 0
-        for site in test_sites:
-            if test_single_site_through_proxy(proxy_tuple, site):
-                working_sites += 1
-
-        print(f"Summary: {working_sites}/{len(test_sites)} sites accessible")
+def _probe_proxy_basic(i, proxy_tuple, test_sites):
+    """Fetch the non-Facebook test sites through one proxy and return the report lines."""
+    host, port, username, password = proxy_tuple
+    lines = [f"\n--- PROXY {i}: {username}@{host}:{port} ---"]
 
-        time.sleep(1)
+    working_sites = 0
+    for site in test_sites:
+        ok, line = _check_site_through_proxy(proxy_tuple, site)
+        lines.append(line)
+        if ok:
+            working_sites += 1
 
-def test_single_site_through_proxy(proxy_tuple, url):
-    """Test a single site through a proxy."""
-    host, port, username, password = proxy_tuple
-    proxy_url = f"http://{username}:{password}@{host}:{port}"
+    lines.append(f"Summary: {working_sites}/{len(test_sites)} sites accessible")
+    return lines
 
+def _check_site_through_proxy(proxy_tuple, url):
+    """Fetch a single site through a proxy; returns (ok, report line)."""
     try:
-        response = requests.get(
+        response = _SESSION.get(
             url,
-            proxies={'http': proxy_url, 'https': proxy_url},
+            proxies=proxy_config(proxy_tuple),
             timeout=10,
             allow_redirects=False
         )
-        print(f"✅ {url}: {response.status_code}")
-        return True
+        return True, f"✅ {url}: {response.status_code}"
     except Exception as e:
-        print(f"❌ {url}: {str(e)[:50]}...")
-        return False
+        return False, f"❌ {url}: {str(e)[:50]}..."
 
 def diagnose_err_empty_response():
-    """Main diagnostic function for ERR_EMPTY_RESPONSE issues."""
+    """Main diagnostic function for ERR_EMPTY_RESPONSE issues.
+
+    Returns True if at least one proxy passed the health check.
+    """
     print("Facebook Proxy Connectivity Diagnostics")
     print("=" * 60)
     print("This tool will help diagnose ERR_EMPTY_RESPONSE issues with Facebook scraping.")
@@ -160,7 +191,7 @@ def diagnose_err_empty_response():
     if not Path("proxies.json").exists():
         print("❌ ERROR: proxies.json file not found!")
         print("Please ensure proxies.json exists with your proxy configuration.")
-        return
+        return False
 
     # Load and validate proxies
     proxies = load_proxies()
@@ -168,7 +199,7 @@ def diagnose_err_empty_response():
 
     if not proxies:
         print("❌ No valid proxies found. Please check your proxies.json format.")
-        return
+        return False
 
     # Test 1: Direct Facebook access
     test_direct_facebook_access()
@@ -226,6 +257,7 @@ def diagnose_err_empty_response():
     print("4. Test with different user agents and browser behaviors")
 
     print(f"\nDiagnostic results saved to: proxy_diagnostics.log")
+    return health_report['working_proxies'] > 0
 
 def test_selenium_proxy_integration():
     """Test if SeleniumBase can use the proxies properly."""
@@ -234,7 +266,6 @@ def test_selenium_proxy_integration():
     print("="*60)
 
     try:
-        from seleniumbase import SB
         from proxy_utils_enhanced import get_proxy_string_with_fallback
 
         proxy_string = get_proxy_string_with_fallback()
@@ -242,6 +273,9 @@ def test_selenium_proxy_integration():
             print("❌ No proxy available for SeleniumBase test")
             return
 
+        # Heavy import; only pay for it once there is a proxy to drive
+        from seleniumbase import SB
+
         print(f"Testing SeleniumBase with proxy: {proxy_string.split('@')[-1] if '@' in proxy_string else proxy_string}")
 
         with SB(uc=True, proxy=proxy_string, headless=True) as sb:
@@ -268,8 +302,10 @@ def main():
     print("Starting comprehensive proxy diagnostics...")
     print(f"Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S')}")
 
-    diagnose_err_empty_response()
-    test_selenium_proxy_integration()
+    if diagnose_err_empty_response():
+        test_selenium_proxy_integration()
+    else:
+        print("\nSkipping SeleniumBase integration test: no working proxies")
 
     print("\n" + "="*60)
     print("DIAGNOSTIC COMPLETE")
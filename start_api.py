@@ -8,22 +8,34 @@ import os
 import sys
 import json
 import subprocess
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import distribution, PackageNotFoundError
 from pathlib import Path
 
+REQUIRED_PACKAGES = ("fastapi", "uvicorn", "seleniumbase", "pydantic")
+
 def check_requirements():
-    """Check if all requirements are installed"""
-    try:
-        import fastapi
-        import uvicorn
-        import seleniumbase
-        import pydantic
-        print("✅ All required packages are installed")
-        return True
-    except ImportError as e:
-        print(f"❌ Missing requirement: {e}")
+    """Check if all requirements are installed (metadata lookup, no imports)"""
+    missing = []
+    for package in REQUIRED_PACKAGES:
+        try:
+            distribution(package)
+        except PackageNotFoundError:
+            # Some editable installs ship without metadata - fall back to importing
+            try:
+                importlib.import_module(package)
+            except ImportError:
+                missing.append(package)
+
+    if missing:
+        print(f"❌ Missing requirement: {', '.join(missing)}")
         print("Please run: pip install -r requirements.txt")
         return False
 
+    print("✅ All required packages are installed")
+    return True
+
 def check_config_files():
     """Check if necessary config files exist"""
     required_files = [
@@ -128,32 +140,35 @@ def start_api(port=8000, workers=1, reload=True):
     except KeyboardInterrupt:
         print("\n👋 API server stopped")
 
-def main():
-    """Main startup routine"""
-    print("🔧 Facebook Scraper API Startup")
-    print("=" * 40)
-
-    # Step 1: Check requirements
-    if not check_requirements():
-        sys.exit(1)
-
-    # Step 2: Create directories
-    create_directories()
+def run_startup_checks():
+    """Run the independent startup checks concurrently, exit on failure"""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        requirements_ok = executor.submit(check_requirements)
+        config_files_ok = executor.submit(check_config_files)
+        executor.submit(create_directories).result()
 
-    # Step 3: Check config files
-    if not check_config_files():
-        sys.exit(1)
+        if not requirements_ok.result() or not config_files_ok.result():
+            sys.exit(1)
 
-    # Step 4: Validate configuration
+    # validate_config reads config.json, so it runs after check_config_files
     if not validate_config():
         sys.exit(1)
 
-    # Step 5: Run tests (optional)
-    run_tests()
+def main(port=8000, workers=1, reload=True, with_tests=False):
+    """Main startup routine"""
+    print("🔧 Facebook Scraper API Startup")
+    print("=" * 40)
+
+    # Step 1: Requirements, directories, config files and config validation
+    run_startup_checks()
 
-    # Step 6: Start the API
+    # Step 2: Run tests (optional, spawns a pytest subprocess)
+    if with_tests:
+        run_tests()
+
+    # Step 3: Start the API
     print("\n" + "=" * 40)
-    start_api()
+    start_api(port=port, workers=workers, reload=reload)
 
 if __name__ == "__main__":
     import argparse
@@ -162,27 +177,8 @@ if __name__ == "__main__":
     parser.add_argument("--port", type=int, default=8000, help="Port to run the API on")
     parser.add_argument("--workers", type=int, default=1, help="Number of worker processes")
     parser.add_argument("--no-reload", action="store_true", help="Disable auto-reload")
-    parser.add_argument("--skip-tests", action="store_true", help="Skip running tests")
+    parser.add_argument("--run-tests", action="store_true", help="Run basic tests before starting")
 
     args = parser.parse_args()
 
-    # Override main function for custom arguments
-    print("🔧 Facebook Scraper API Startup")
-    print("=" * 40)
-
-    if not check_requirements():
-        sys.exit(1)
-
-    create_directories()
-
-    if not check_config_files():
-        sys.exit(1)
-
-    if not validate_config():
-        sys.exit(1)
-
-    if not args.skip_tests:
-        run_tests()
-
-    print("\n" + "=" * 40)
-    start_api(port=args.port, workers=args.workers, reload=not args.no_reload)
+    main(port=args.port, workers=args.workers, reload=not args.no_reload, with_tests=args.run_tests)
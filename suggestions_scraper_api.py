@@ -7,26 +7,12 @@ import os
 
 # Fix Windows console encoding for Unicode output
 if sys.platform == "win32":
-    # Set environment variable for UTF-8 encoding
     os.environ['PYTHONIOENCODING'] = 'utf-8'
-
-    # Wrap print function to handle encoding errors gracefully
-    original_print = print
-    def safe_print(*args, **kwargs):
+    for stream in (sys.stdout, sys.stderr):
         try:
-            return original_print(*args, **kwargs)
-        except UnicodeEncodeError:
-            # Convert all args to strings and handle encoding
-            safe_args = []
-            for arg in args:
-                try:
-                    safe_args.append(str(arg).encode('ascii', 'replace').decode('ascii'))
-                except:
-                    safe_args.append(repr(arg))
-            return original_print(*safe_args, **kwargs)
-
-    # Replace print function globally
-    print = safe_print
+            stream.reconfigure(encoding="utf-8", errors="replace")
+        except Exception:
+            pass
 
 """
 Suggestions Scraper API - v2 (Robust approach)
@@ -35,25 +21,40 @@ using the exact same robust logic as ads_and_suggestions_scraper2.py
 """
 
 import json
+import logging
 import time
 import re
 import unicodedata
 import asyncio
-import subprocess
-import os
-import glob
+import queue
+import socket
+import shutil
+import atexit
+import threading
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional
-from urllib.parse import urlparse, parse_qs, urlencode, urlunparse, quote
+from types import MappingProxyType
+from typing import List, Dict, Any, Tuple, Optional, Mapping
+from urllib.parse import urlencode
 from datetime import datetime
 
+import aiofiles
+import orjson
 from seleniumbase import SB
 from proxy_utils_enhanced import get_proxy_string_with_fallback  # Import enhanced proxy utility
-from selenium.common.exceptions import (
-    NoSuchElementException, StaleElementReferenceException,
-    ElementNotInteractableException,
-)
+from logging_utils import buffer_logger
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
 from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+# Scroll/parse loops log per batch; buffer and write at advertiser boundaries
+# (or when the buffer fills). Errors flush the buffer immediately.
+_log_buffer = buffer_logger(logger, capacity=1024)
 
 # Global settings
 COOKIE_FILE = Path("./saved_cookies/facebook_cookies.txt")
@@ -71,193 +72,410 @@ COMMON_HEAD = (
     "/html/body/div[1]/div/div/div/div/div/div/div[1]/div/div/div"
 )
 MONTH_BASE = f"{COMMON_HEAD}/div[5]/div[2]"   # COMMON_HEAD defined earlier
-GAP_LIMIT  = 5                                # stop after 5 empty slots
-
-def load_cookies() -> list[dict]:
-    """Load cookies from file with proper error handling."""
-    if not COOKIE_FILE.exists():
-        print(f"[WARNING] Cookie file not found: {COOKIE_FILE}")
-        return []
 
+# ── Concurrency ─────────────────────────────────────────────────────────────
+MAX_CONCURRENCY = 4                           # browsers running at once
+ADVERTISER_CONCURRENCY = 3                    # browsers per scrape for advertiser pages (FB rate limits)
+ADVERTISERS_PER_BROWSER = 25                  # restart a worker browser after this many advertisers
+ADVERTISER_TABS = 3                           # advertiser pages loading ahead in background tabs
+MAX_HELPER_BROWSERS = 4                       # extra advertiser-worker browsers alive across all scrapes
+_HELPER_BROWSERS = threading.BoundedSemaphore(MAX_HELPER_BROWSERS)
+_SCRAPE_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENCY)
+_RESULTS_LOCK = threading.Lock()                # guards Results/*.jsonl appends
+
+@lru_cache(maxsize=4)
+def _load_cookies_cached(mtime: float) -> Tuple[Mapping[str, Any], ...]:
+    """Parse the cookie file once per modification time (read-only result)."""
     try:
         raw_text = COOKIE_FILE.read_text(encoding="utf-8")
         cookies = json.loads(raw_text)
-        print(f"[SUCCESS] Loaded {len(cookies)} cookies from {COOKIE_FILE}")
-        return cookies
+        logger.info(f"Loaded {len(cookies)} cookies from {COOKIE_FILE}")
+        return tuple(MappingProxyType(dict(ck)) for ck in cookies)
     except UnicodeDecodeError:
-        print(f"[ERROR] Could not decode cookie file as UTF-8: {COOKIE_FILE}")
-        return []
+        logger.error(f"Could not decode cookie file as UTF-8: {COOKIE_FILE}")
+        return ()
     except json.JSONDecodeError as e:
-        print(f"[ERROR] Could not parse JSON in cookie file: {COOKIE_FILE} - {e}")
-        return []
+        logger.error(f"Could not parse JSON in cookie file: {COOKIE_FILE} - {e}")
+        return ()
     except Exception as e:
-        print(f"[ERROR] Unexpected error loading cookies: {e}")
+        logger.error(f"Unexpected error loading cookies: {e}")
+        return ()
+
+def load_cookies() -> list[dict]:
+    """Load cookies from file with proper error handling (cached by file mtime)."""
+    if not COOKIE_FILE.exists():
+        logger.warning(f"Cookie file not found: {COOKIE_FILE}")
         return []
 
+    return [dict(ck) for ck in _load_cookies_cached(COOKIE_FILE.stat().st_mtime)]
+
+# Browser-export sameSite values -> Chrome DevTools Protocol values
+_CDP_SAME_SITE = {"no_restriction": "None", "none": "None", "lax": "Lax", "strict": "Strict"}
+
+def _to_cdp(cookie: dict) -> dict:
+    """Convert a Selenium / browser-export cookie dict to a CDP CookieParam."""
+    cdp = {k: cookie[k] for k in ("name", "value", "domain", "path", "secure", "httpOnly") if k in cookie}
+    expires = cookie.get("expiry", cookie.get("expirationDate"))
+    if expires is not None and not cookie.get("session"):
+        cdp["expires"] = expires
+    same_site = _CDP_SAME_SITE.get(str(cookie.get("sameSite", "")).lower())
+    if same_site:
+        cdp["sameSite"] = same_site
+    if "domain" not in cdp:
+        cdp["url"] = "https://www.facebook.com"
+    return cdp
+
+def restore_cookies(sb) -> None:
+    """Set all saved cookies in one CDP call, falling back to add_cookie per cookie."""
+    cookies = load_cookies()
+    if not cookies or not (hasattr(sb, 'driver') and sb.driver):
+        return
+    try:
+        sb.driver.execute_cdp_cmd("Network.setCookies", {"cookies": [_to_cdp(ck) for ck in cookies]})
+        return
+    except Exception as e:
+        logger.debug("CDP cookie restore failed, adding cookies one by one: %s", e)
+
+    for ck in cookies:
+        try:
+            sb.driver.add_cookie(ck)
+        except Exception:
+            pass
+
+def _login(sb) -> None:
+    """Open Facebook and restore the saved session cookies."""
+    logger.info("Opening Facebook...")
+    sb.open("https://facebook.com")
+    logger.info("Restoring session cookies...")
+    restore_cookies(sb)
+
+def _log_connection_error(e: Exception) -> None:
+    """Log a readable explanation for a failed Facebook connection."""
+    error_msg = str(e)
+    if "ERR_NAME_NOT_RESOLVED" in error_msg:
+        logger.error("DNS resolution failed - cannot reach Facebook through proxy")
+        logger.error("This might be caused by:")
+        logger.error("        - Proxy server DNS issues")
+        logger.error("        - Proxy server blocking Facebook")
+        logger.error("        - Network connectivity problems")
+    else:
+        logger.error(f"Failed to initialize Facebook connection: {error_msg}")
+
+# ── Browser pool ────────────────────────────────────────────────────────────
+
+# Persistent Chrome profiles hold the logged-in session; keep them out of the checkout
+PROFILES_DIR = Path(os.getenv("BROWSER_PROFILES_DIR")
+                    or Path.home() / ".cache" / "facebook-scraper" / "profiles")
+
+class _BrowserGone(Exception):
+    """The browser died mid-run; raised to get it evicted from the pool."""
+
+def _driver_alive(sb) -> bool:
+    """True if the browser's WebDriver session still answers."""
+    try:
+        sb.driver.current_url
+        return True
+    except Exception:
+        return False
+
+class BrowserPool:
+    """
+    Pool of long-lived SB browsers, each with its own persistent profile.
+
+    A slot's browser is started and logged in (cookie restore) the first
+    time it is checked out; later checkouts reuse it as-is. A browser is
+    restarted if it is requested with different settings, and thrown away
+    if the caller raises while using it.
+
+    Profiles live under a per-process directory: Chrome refuses a profile
+    that another process (e.g. a second API worker) already has open.
+    """
+
+    def __init__(self, size: int = MAX_CONCURRENCY, profiles_dir: Path = PROFILES_DIR):
+        self.profiles_dir = profiles_dir
+        self._free_slots: queue.LifoQueue = queue.LifoQueue()
+        for slot_id in range(size):
+            self._free_slots.put(slot_id)
+        self._browsers: Dict[int, Tuple[dict, Any, Any]] = {}   # slot -> (kwargs, context, sb)
+
+    @property
+    def process_dir(self) -> Path:
+        """This process's share of the profiles directory."""
+        return self.profiles_dir / f"pid_{os.getpid()}"
+
+    @contextmanager
+    def acquire(self, headless: bool = True, proxy: Optional[str] = None):
+        """Check out a logged-in browser, returned to the pool on exit."""
+        slot_id = self._free_slots.get()
+        try:
+            sb = self._get_browser(slot_id, headless, proxy)
+            try:
+                yield sb
+            except Exception:
+                # Don't hand a browser in an unknown state to the next caller
+                self._close_browser(slot_id)
+                raise
+        finally:
+            self._free_slots.put(slot_id)
+
+    def _get_browser(self, slot_id: int, headless: bool, proxy: Optional[str]):
+        sb_kwargs = {
+            "uc": True,
+            "headless": headless,
+            "user_data_dir": str((self.process_dir / f"slot_{slot_id}").resolve()),
+        }
+        if proxy:
+            sb_kwargs["proxy"] = proxy
+
+        current = self._browsers.get(slot_id)
+        if current and current[0] == sb_kwargs:
+            if _driver_alive(current[2]):
+                return current[2]
+            logger.warning(f"Pooled browser in slot {slot_id} is gone, restarting it")
+        self._close_browser(slot_id)
+
+        logger.info(f"Starting browser for pool slot {slot_id}")
+        self.process_dir.mkdir(parents=True, exist_ok=True)
+        context = SB(**sb_kwargs)
+        sb = context.__enter__()
+        self._browsers[slot_id] = (sb_kwargs, context, sb)
+        try:
+            _login(sb)
+        except Exception as e:
+            _log_connection_error(e)
+            self._close_browser(slot_id)
+            raise
+        return sb
+
+    def _close_browser(self, slot_id: int) -> None:
+        browser = self._browsers.pop(slot_id, None)
+        if browser:
+            try:
+                browser[1].__exit__(None, None, None)
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        """Shut down every pooled browser and remove this process's profiles."""
+        for slot_id in list(self._browsers):
+            self._close_browser(slot_id)
+        shutil.rmtree(self.process_dir, ignore_errors=True)
+
+BROWSER_POOL = BrowserPool()
+atexit.register(BROWSER_POOL.close)
+
+def xpath_literal(s: str) -> str:
+    """Quote *s* as an XPath string literal (concat() when it holds both quote types)."""
+    if '"' not in s:
+        return f'"{s}"'
+    if "'" not in s:
+        return f"'{s}'"
+    parts = s.split('"')
+    return "concat(" + ", '\"', ".join(f'"{p}"' for p in parts) + ")"
+
+def country_option_xpath(country: str) -> str:
+    """
+    XPath matching the country option in the dropdown.
+
+    An exact text match wins; options merely containing the name (e.g.
+    "South Sudan" for "Sudan") only match when no exact option exists.
+    """
+    lit = xpath_literal(country)
+    exact = f'{_COUNTRY_OPTIONS_XPATH}[normalize-space(text())={lit}]'
+    partial = f'{_COUNTRY_OPTIONS_XPATH}[contains(normalize-space(text()), {lit})][not({exact})]'
+    return f'{exact} | {partial}'
+
 def wait_click(sb, selector: str, *, by="css selector", timeout=10):
-    """Wait for element to be visible and click it with error handling."""
+    """Wait for element to be clickable and click it with error handling."""
     try:
-        sb.wait_for_element_visible(selector, by=by, timeout=timeout)
+        # Visible isn't enough while dropdowns fade in - wait until clickable
+        sb.wait_for_element_clickable(selector, by=by, timeout=timeout)
         sb.click(selector, by=by)
-        print(f"[SUCCESS] Clicked element: {selector}")
+        logger.info(f"Clicked element: {selector}")
     except Exception as e:
-        print(f"[ERROR] Failed to click element: {selector}")
-        print(f"[ERROR] Error details: {str(e)}")
+        logger.error(f"Failed to click element: {selector}")
+        logger.error(f"Error details: {str(e)}")
 
-        # Try to provide helpful debugging info
+        # Try to provide helpful debugging info (extra WebDriver calls - DEBUG only)
         try:
-            if by == "xpath":
+            if by == "xpath" and logger.isEnabledFor(logging.DEBUG):
                 elements = sb.find_elements(selector, by=by)
-                print(f"[DEBUG] Found {len(elements)} elements matching XPath")
+                logger.debug("Found %s elements matching XPath", len(elements))
                 if len(elements) > 0:
                     for i, elem in enumerate(elements[:3]):  # Show first 3 elements
                         try:
-                            print(f"[DEBUG] Element {i}: text='{elem.text}', visible={elem.is_displayed()}")
+                            logger.debug("Element %s: text='%s', visible=%s", i, elem.text, elem.is_displayed())
                         except:
-                            print(f"[DEBUG] Element {i}: could not get details")
+                            logger.debug("Element %s: could not get details", i)
         except Exception as debug_error:
-            print(f"[DEBUG] Could not get debugging info: {debug_error}")
+            logger.debug("Could not get debugging info: %s", debug_error)
 
         raise e
 
-def safe_type(sb, selector: str, text: str, *, by="css selector", press_enter: bool = True, timeout: int = 10):
-    """Safely type text into an input field with enhanced error handling."""
+def safe_type(sb, selector: str, text: str, *, by="css selector", press_enter: bool = True,
+              timeout: int = 10, ready_selector: str | None = None, ready_timeout: int = 5):
+    """Safely type text into an input field with enhanced error handling.
+
+    Instead of fixed sleeps, waits for ``ready_selector`` (xpath) to appear after
+    typing and for the document to finish loading after <Enter>.
+    """
     try:
         sb.wait_for_element_visible(selector, by=by, timeout=timeout)
         elm = sb.find_element(selector, by=by)
         elm.clear()
-        sb.sleep(0.5)  # Small delay after clearing
         elm.send_keys(text)
-        time.sleep(1.0)
+        if ready_selector:
+            try:
+                sb.wait_for_element_visible(ready_selector, by="xpath", timeout=ready_timeout)
+            except Exception:
+                logger.debug("Nothing matched %s after typing '%s'", ready_selector, text)
         if press_enter:
             elm.send_keys(Keys.RETURN)
-            time.sleep(2.0)
-        print(f"[SUCCESS] Typed '{text}' into element: {selector}")
+            sb.wait_for_ready_state_complete(timeout=ready_timeout)
+        logger.info(f"Typed '{text}' into element: {selector}")
     except Exception as e:
-        print(f"[ERROR] Failed to type into element: {selector}")
-        print(f"[ERROR] Text to type: '{text}'")
-        print(f"[ERROR] Error details: {str(e)}")
+        logger.error(f"Failed to type into element: {selector}")
+        logger.error(f"Text to type: '{text}'")
+        logger.error(f"Error details: {str(e)}")
         raise e
 
-def extract_suggestions(sb, keyword: str) -> list[Dict[str, Any]]:
-    """Extract suggestions from the keyword dropdown - exact v2 logic."""
+_COUNTRY_DROPDOWN_XPATH = '//div[div/div/text()="All" or div/div/text()="Country"]/..'
+_COUNTRY_SEARCH_XPATH = '//input[@placeholder="Search for country"]'
+_COUNTRY_OPTIONS_XPATH = '//div[contains(@id,"js_")]'
+_AD_CATEGORY_XPATH = '//div[div/div/text()="Ad category"]/..'
+_ALL_ADS_XPATH = '//span[text()="All ads"]/../../..'
+_KEYWORD_INPUT_XPATH = ('//input[@type="search" and contains(@placeholder,"keyword") '
+                        'and not(@aria-disabled="true")]')
+_OPTION_CSS = 'li[role="option"]'
+
+# Returns [{id, text}] for every dropdown option in a single WebDriver call
+_OPTIONS_JS = """
+return Array.from(document.querySelectorAll(arguments[0]))
+    .map(el => ({id: el.id || '', text: el.innerText || ''}));
+"""
+
+_OPTIONS_SETTLE_POLL = 0.3       # seconds between typeahead snapshots
+_OPTIONS_SETTLE_TIMEOUT = 3      # upper bound (the old fixed sleep)
+
+def _settled_options(sb, timeout: float = _OPTIONS_SETTLE_TIMEOUT,
+                     poll: float = _OPTIONS_SETTLE_POLL) -> list:
+    """
+    Read the dropdown options once they stop changing.
+
+    The typeahead can still be showing results for an earlier prefix of the
+    keyword when the first option becomes visible, so options are re-read
+    until two polls in a row return the same option ids (or ``timeout``).
+    """
+    deadline = time.monotonic() + timeout
+    rows = sb.execute_script(_OPTIONS_JS, _OPTION_CSS) or []
+    while time.monotonic() < deadline:
+        time.sleep(poll)
+        latest = sb.execute_script(_OPTIONS_JS, _OPTION_CSS) or []
+        if [r.get("id") for r in latest] == [r.get("id") for r in rows]:
+            return latest
+        rows = latest
+    return rows
+
+def _is_stale(element) -> bool:
+    """True once ``element`` has been removed from the DOM."""
+    try:
+        element.is_enabled()
+        return False
+    except StaleElementReferenceException:
+        return True
+
+def extract_suggestions(sb, keyword: str, search_box=None) -> list[Dict[str, Any]]:
+    """Extract suggestions from the keyword dropdown - exact v2 logic.
+
+    Pass ``search_box`` (the keyword <input> WebElement) to reuse it across
+    keywords on the same page instead of resolving the XPath again.
+    """
     suggestions: list[dict] = []
-    KEYWORD_INPUT = ('//input[@type="search" and contains(@placeholder,"keyword") '
-                     'and not(@aria-disabled="true")]')
 
-    # Type WITHOUT <Enter> so the dropdown stays open
-    safe_type(sb, KEYWORD_INPUT, keyword, by="xpath", press_enter=False)
-    time.sleep(3)
+    if search_box is None:
+        sb.wait_for_element_visible(_KEYWORD_INPUT_XPATH, by="xpath", timeout=10)
+        search_box = sb.find_element(_KEYWORD_INPUT_XPATH, by="xpath")
 
-    # Try to harvest all <li role="option"> nodes
-    items = sb.find_elements("//li[@role='option']", by="xpath")
-    for item in items:
+    # Options left over from a previous keyword on the same page must be
+    # replaced before harvesting, otherwise the wait below returns at once
+    stale_options = sb.find_elements(_OPTION_CSS, by="css selector")
+
+    # Type WITHOUT <Enter> so the dropdown stays open
+    search_box.clear()
+    search_box.send_keys(keyword)
+    if stale_options:
         try:
-            data = {
-                "page_id":    item.get_attribute("id") or "",
-                "name":       item.text.split("\n")[0].strip(),
-                "raw_text":   item.text.strip(),
-            }
-            if data["name"]:
-                suggestions.append(data)
-        except Exception:
-            continue
+            WebDriverWait(sb.driver, 5, poll_frequency=0.15).until(
+                lambda _: _is_stale(stale_options[0]))
+        except TimeoutException:
+            logger.debug("Dropdown options were not refreshed for '%s'", keyword)
+    try:
+        sb.wait_for_element_visible(_OPTION_CSS, by="css selector", timeout=5)
+    except Exception:
+        logger.debug("No dropdown options appeared for '%s'", keyword)
+
+    # Harvest all <li role="option"> nodes (one round-trip per poll) once
+    # the list has settled on this keyword's results
+    try:
+        rows = _settled_options(sb)
+    except Exception:
+        rows = None
+
+    if rows is not None:
+        for row in rows:
+            raw_text = (row.get("text") or "").strip()
+            name = raw_text.split("\n")[0].strip()
+            if name:
+                suggestions.append({
+                    "page_id":    row.get("id") or "",
+                    "name":       name,
+                    "raw_text":   raw_text,
+                })
+    else:
+        items = sb.find_elements(_OPTION_CSS, by="css selector")
+        for item in items:
+            try:
+                data = {
+                    "page_id":    item.get_attribute("id") or "",
+                    "name":       item.text.split("\n")[0].strip(),
+                    "raw_text":   item.text.strip(),
+                }
+                if data["name"]:
+                    suggestions.append(data)
+            except Exception:
+                continue
 
     # Clear search box for next keyword
-    sb.find_element(KEYWORD_INPUT, by="xpath").clear()
+    search_box.clear()
     return suggestions
 
+# "pageID:123456" or a bare numeric ID; quoted keyword rows ("properties") never match
+_PAGE_ID_RE = re.compile(r'(?:pageID:)?(\d+)')
+
 def _extract_page_id_from_suggestion(suggestion: Dict[str, Any]) -> str | None:
     """Extract page_id from suggestion, handling both direct pageID and quoted formats."""
-    page_id = suggestion.get("page_id", "")
-
-    # Handle pageID:123456 format
-    if page_id.startswith("pageID:"):
-        return page_id.split(":", 1)[1]
-
-    # Handle quoted format like "properties" - skip this as it's not a real page
-    if page_id.startswith('"') and page_id.endswith('"'):
-        return None
-
-    # If it's already a numeric ID, return it
-    if page_id.isdigit():
-        return page_id
+    m = _PAGE_ID_RE.fullmatch(suggestion.get("page_id") or "")
+    return m.group(1) if m else None
 
-    return None
 
+# Fixed query for an advertiser's ads page; only view_all_page_id varies
+_ADVERTISER_BASE_PARAMS = urlencode({
+    "active_status": "active",
+    "ad_type": "all",
+    "country": "ALL",
+    "is_targeted_country": "false",
+    "media_type": "all",
+    "search_type": "page",
+})
 
 def _build_advertiser_url(country: str, page_id: str) -> str:
-    """Build URL for advertiser's ads page."""
-    # Map country names to country codes (add more as needed)
-    country_code_map = {
-        "Thailand": "TH",
-        "United States": "US",
-        "United Kingdom": "GB",
-        "Canada": "CA",
-        "Australia": "AU",
-        "Germany": "DE",
-        "France": "FR",
-        "Italy": "IT",
-        "Spain": "ES",
-        "Netherlands": "NL",
-        "Belgium": "BE",
-        "Sweden": "SE",
-        "Norway": "NO",
-        "Denmark": "DK",
-        "Finland": "FI",
-        "Poland": "PL",
-        "Czech Republic": "CZ",
-        "Hungary": "HU",
-        "Austria": "AT",
-        "Switzerland": "CH",
-        "Ireland": "IE",
-        "Portugal": "PT",
-        "Greece": "GR",
-        "Turkey": "TR",
-        "India": "IN",
-        "Japan": "JP",
-        "South Korea": "KR",
-        "Singapore": "SG",
-        "Malaysia": "MY",
-        "Indonesia": "ID",
-        "Philippines": "PH",
-        "Vietnam": "VN",
-        "Brazil": "BR",
-        "Mexico": "MX",
-        "Argentina": "AR",
-        "Chile": "CL",
-        "Colombia": "CO",
-        "South Africa": "ZA",
-        "Egypt": "EG",
-        "Nigeria": "NG",
-        "Kenya": "KE",
-        "Morocco": "MA",
-        "Israel": "IL",
-        "United Arab Emirates": "AE",
-        "Saudi Arabia": "SA",
-        "Russia": "RU",
-        "Ukraine": "UA",
-        "China": "CN",
-        "Taiwan": "TW",
-        "Hong Kong": "HK",
-        "New Zealand": "NZ",
-    }
-
-    # Get country code, fallback to country name if not found
-    country_code = country_code_map.get(country, country)
-
-    # Build the URL
-    return (
-        f"https://www.facebook.com/ads/library/"
-        f"?active_status=active&ad_type=all&country=ALL"
-        f"&is_targeted_country=false&media_type=all"
-        f"&search_type=page&view_all_page_id={page_id}"
-    )
+    """Build URL for advertiser's ads page (all countries; ``country`` is unused)."""
+    return f"https://www.facebook.com/ads/library/?{_ADVERTISER_BASE_PARAMS}&view_all_page_id={page_id}"
 
 
 def extract_advertiser_ads(sb, country: str, page_id: str, advertiser_name: str, limit: int = None):
     """Extract ads from a specific advertiser's page."""
-    print(f"[INFO] Scraping ads from advertiser: {advertiser_name} (Page ID: {page_id})")
+    logger.info(f"Scraping ads from advertiser: {advertiser_name} (Page ID: {page_id})")
 
     # Build and navigate to advertiser URL
     advertiser_url = _build_advertiser_url(country, page_id)
@@ -265,9 +483,9 @@ def extract_advertiser_ads(sb, country: str, page_id: str, advertiser_name: str,
     # Apply filters to the URL (if available)
     filtered_url = advertiser_url  # Basic implementation, can be enhanced with filters
 
-    print(f"[INFO] Navigating to: {filtered_url}")
+    logger.info(f"Navigating to: {filtered_url}")
     sb.open(filtered_url)
-    sb.sleep(5)
+    _wait_for_more_cards(sb, 0, timeout=10)
 
     # Extract ads using the existing logic (with infinite scroll)
     ads = extract_ads(sb, limit=limit)
@@ -277,87 +495,10 @@ def extract_advertiser_ads(sb, country: str, page_id: str, advertiser_name: str,
         ad["scraped_from_advertiser"] = advertiser_name
         ad["advertiser_page_id"] = page_id
 
-    print(f"[INFO] Found {len(ads)} ads from advertiser: {advertiser_name}")
+    logger.info(f"Found {len(ads)} ads from advertiser: {advertiser_name}")
+    _log_buffer.flush()
     return ads
 
-    # Handle quoted format like "properties" - skip this as it's not a real page
-    if page_id.startswith('"') and page_id.endswith('"'):
-        return None
-
-    # If it's already a numeric ID, return it
-    if page_id.isdigit():
-        return page_id
-
-    return None
-
-def _build_advertiser_url(country: str, page_id: str) -> str:
-    """Build URL for advertiser's ads page."""
-    # Map country names to country codes (add more as needed)
-    country_code_map = {
-        "Thailand": "TH",
-        "United States": "US",
-        "United Kingdom": "GB",
-        "Canada": "CA",
-        "Australia": "AU",
-        "Germany": "DE",
-        "France": "FR",
-        "Italy": "IT",
-        "Spain": "ES",
-        "Netherlands": "NL",
-        "Belgium": "BE",
-        "Sweden": "SE",
-        "Norway": "NO",
-        "Denmark": "DK",
-        "Finland": "FI",
-        "Poland": "PL",
-        "Czech Republic": "CZ",
-        "Hungary": "HU",
-        "Austria": "AT",
-        "Switzerland": "CH",
-        "Ireland": "IE",
-        "Portugal": "PT",
-        "Greece": "GR",
-        "Turkey": "TR",
-        "India": "IN",
-        "Japan": "JP",
-        "South Korea": "KR",
-        "Singapore": "SG",
-        "Malaysia": "MY",
-        "Indonesia": "ID",
-        "Philippines": "PH",
-        "Vietnam": "VN",
-        "Brazil": "BR",
-        "Mexico": "MX",
-        "Argentina": "AR",
-        "Chile": "CL",
-        "Colombia": "CO",
-        "South Africa": "ZA",
-        "Egypt": "EG",
-        "Nigeria": "NG",
-        "Kenya": "KE",
-        "Morocco": "MA",
-        "Israel": "IL",
-        "United Arab Emirates": "AE",
-        "Saudi Arabia": "SA",
-        "Russia": "RU",
-        "Ukraine": "UA",
-        "China": "CN",
-        "Taiwan": "TW",
-        "Hong Kong": "HK",
-        "New Zealand": "NZ",
-    }
-
-    # Get country code, fallback to country name if not found
-    country_code = country_code_map.get(country, country)
-
-    # Build the URL
-    return (
-        f"https://www.facebook.com/ads/library/"
-        f"?active_status=active&ad_type=all&country=ALL"
-        f"&is_targeted_country=false&media_type=all"
-        f"&search_type=page&view_all_page_id={page_id}"
-    )
-
 # ── Data saving functionality ─────────────────────────────────────────────
 
 def next_output_path(mode: str = "suggestions") -> Path:
@@ -367,240 +508,276 @@ def next_output_path(mode: str = "suggestions") -> Path:
     if APPEND:
         return OUTPUT_DIR / f"{mode}.json"
     else:
-        counter = 1
-        while True:
-            p = OUTPUT_DIR / f"{mode}_{counter:03d}.json"
-            if not p.exists():
-                return p
-            counter += 1
+        # One directory listing instead of a stat() per candidate name
+        pattern = re.compile(rf"{re.escape(mode)}_(\d+)\.json")
+        nums = [int(m.group(1)) for p in OUTPUT_DIR.glob(f"{mode}_*.json")
+                if (m := pattern.fullmatch(p.name))]
+        counter = max(nums) + 1 if nums else 1
+        return OUTPUT_DIR / f"{mode}_{counter:03d}.json"
+
+
+def append_jsonl(path: Path, record: Dict[str, Any]) -> None:
+    """Append one record to a JSON Lines file."""
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
 
 
 def save_data_to_results(data: Dict[str, Any]) -> None:
-    """Save data to Results directory with append functionality"""
+    """Append data to the Results JSON Lines file (flush_to_json merges it later)"""
     try:
-        out_file = next_output_path("suggestions")
+        out_file = next_output_path("suggestions").with_suffix(".jsonl")
+
+        with _RESULTS_LOCK:
+            append_jsonl(out_file, data)
+        logger.info(f"Data saved to {out_file}")
+
+    except Exception as e:
+        logger.error(f"Failed to save data: {e}")
+        # Try to save to a backup file
+        try:
+            backup_file = OUTPUT_DIR / f"backup_suggestions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            backup_file.write_text(
+                json.dumps([data], indent=2, ensure_ascii=False),
+                encoding="utf-8"
+            )
+            logger.info(f"Data saved to backup file: {backup_file}")
+        except Exception as backup_error:
+            logger.error(f"Failed to save backup file: {backup_error}")
+
+
+def flush_to_json(mode: str = "suggestions") -> Path:
+    """
+    Merge the JSON Lines records into the pretty-printed JSON results file.
+
+    The .jsonl file is removed afterwards, so every record lives in exactly
+    one of the two files.
+    """
+    out_file = next_output_path(mode)
+    jsonl_file = out_file.with_suffix(".jsonl")
 
+    with _RESULTS_LOCK:
+        if not jsonl_file.exists():
+            return out_file
+
+        existing = []
         if out_file.exists():
             try:
                 existing = json.loads(out_file.read_text(encoding="utf-8"))
                 if not isinstance(existing, list):
                     existing = []
             except Exception as e:
-                print(f"[WARNING] Error reading existing file {out_file}: {e}, starting fresh")
+                logger.warning(f"Error reading existing file {out_file}: {e}, starting fresh")
                 existing = []
-        else:
-            existing = []
 
-        existing.append(data)
+        with jsonl_file.open("r", encoding="utf-8") as f:
+            existing.extend(json.loads(line) for line in f if line.strip())
 
-        # Save data with UTF-8 encoding
         out_file.write_text(
             json.dumps(existing, indent=2, ensure_ascii=False),
             encoding="utf-8"
         )
-        print(f"[INFO] Data saved to {out_file}")
-        print(f"[INFO] Total records in file: {len(existing)}")
+        jsonl_file.unlink()
 
-    except Exception as e:
-        print(f"[ERROR] Failed to save data: {e}")
-        # Try to save to a backup file
-        try:
-            backup_file = OUTPUT_DIR / f"backup_suggestions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            backup_file.write_text(
-                json.dumps([data], indent=2, ensure_ascii=False),
-                encoding="utf-8"
-            )
-            print(f"[INFO] Data saved to backup file: {backup_file}")
-        except Exception as backup_error:
-            print(f"[ERROR] Failed to save backup file: {backup_error}")
+    logger.info(f"Exported {jsonl_file} to {out_file}")
+    logger.info(f"Total records in file: {len(existing)}")
+    return out_file
 
 
 # ── Main scraping functions ───────────────────────────────────────────────
 
-def scrape_suggestions_sync(country: str, keyword: str, scrape_ads: bool = False,
-                           advertiser_ads_limit: int = 100, headless: bool = True) -> dict:
-    """
-    Main suggestions scraping function - exact v2 logic.
+PREFLIGHT_TTL = 60  # seconds a successful preflight is trusted without re-checking
+_preflight_ok: Dict[Optional[str], float] = {}
 
-    Args:
-        country: Country to scrape from
-        keyword: Keyword to search for
-        scrape_ads: Whether to also scrape ads from each advertiser found
-        advertiser_ads_limit: Maximum number of ads to extract per advertiser page
-        headless: Whether to run in headless mode
+def _preflight(proxy_string: Optional[str], timeout: float = 3) -> None:
+    """
+    Cheap reachability check run before launching Chromium.
 
-    Returns:
-        Dictionary with suggestions and optionally ads data
+    With a proxy, opens a TCP connection to the proxy server; without one,
+    resolves www.facebook.com. Raises RuntimeError on failure. Successes are
+    remembered for PREFLIGHT_TTL seconds so back-to-back jobs skip the
+    lookup; failures are never cached.
     """
-    print(f"[INFO] Starting suggestions scraping for: {country} | {keyword}")
+    checked_at = _preflight_ok.get(proxy_string)
+    if checked_at is not None and time.monotonic() - checked_at < PREFLIGHT_TTL:
+        return
+    try:
+        if proxy_string:
+            host, _, port = proxy_string.rpartition("@")[2].rpartition(":")
+            socket.create_connection((host, int(port)), timeout=timeout).close()
+        else:
+            socket.getaddrinfo("www.facebook.com", 443)
+    except (OSError, ValueError) as e:
+        target = proxy_string.rpartition("@")[2] if proxy_string else "www.facebook.com"
+        logger.error(f"Preflight check failed for {target}: {e}")
+        raise RuntimeError(f"Preflight failed: cannot reach {target} ({e})") from e
+    _preflight_ok[proxy_string] = time.monotonic()
+
+def _scrape_advertisers(sb, country: str, targets: list, limit: int, total: int) -> list:
+    """Scrape ads from each (idx, page_id, suggestion) target in one browser."""
+    ads = []
+    for idx, page_id, suggestion in targets:
+        advertiser_name = suggestion.get("name", "Unknown")
+        try:
+            logger.info(f"({idx}/{total}) Scraping ads from advertiser: {advertiser_name}")
 
-    # Get proxy configuration
-    proxy_string = get_proxy_string_with_fallback()
-    if proxy_string:
-        print(f"[INFO] Using proxy: {proxy_string.split('@')[-1] if '@' in proxy_string else proxy_string}")
-    else:
-        print("[INFO] No proxy available, running without proxy")
+            # Extract ads from this advertiser with specific limit
+            ads_from_advertiser = extract_advertiser_ads(
+                sb, country, page_id, advertiser_name, limit=limit
+            )
+            ads.extend(ads_from_advertiser)
 
-    # Initialize SeleniumBase with or without proxy
-    sb_kwargs = {"uc": True, "headless": headless}
-    if proxy_string:
-        sb_kwargs["proxy"] = proxy_string
+            logger.info(f"Collected {len(ads_from_advertiser)} ads from {advertiser_name}")
 
-    with SB(**sb_kwargs) as sb:
-        try:
-            # ── Login bootstrap ───────────────────────────────────────────────
-            print("[INFO] Opening Facebook...")
-            sb.open("https://facebook.com")
-            print("[INFO] Restoring session cookies...")
-            for ck in load_cookies():
-                try:
-                    if hasattr(sb, 'driver') and sb.driver:
-                        sb.driver.add_cookie(ck)
-                except Exception:
-                    pass
-            sb.open(AD_LIBRARY_URL)
-            sb.sleep(5)
+            # Small delay between advertiser pages
+            sb.sleep(2)
 
         except Exception as e:
-            error_msg = str(e)
-            if "ERR_NAME_NOT_RESOLVED" in error_msg:
-                print(f"[ERROR] DNS resolution failed - cannot reach Facebook through proxy")
-                print(f"[ERROR] This might be caused by:")
-                print(f"        - Proxy server DNS issues")
-                print(f"        - Proxy server blocking Facebook")
-                print(f"        - Network connectivity problems")
-            else:
-                print(f"[ERROR] Failed to initialize Facebook connection: {error_msg}")
-
-            # Re-raise the exception to be handled by the calling function
-            raise e
-
-        # ── Country Selection (EXACT v2 logic) ────────────────────────────
-        print(f"[INFO] Selecting country: {country}")
-
-        # 1) Country dropdown
-        wait_click(sb, '//div[div/div/text()="All" or div/div/text()="Country"]/..', by="xpath")
-        safe_type(sb, '//input[@placeholder="Search for country"]', country, by="xpath")
-
-        # More robust country selection with multiple fallback selectors
-        country_selectors = [
-            f'//div[contains(@id,"js_") and text()="{country}"]',
-            f'//div[contains(@id,"js_") and contains(text(),"{country}")]',
-            f'//div[text()="{country}"]',
-            f'//div[contains(text(),"{country}")]',
-            f'//span[text()="{country}"]',
-            f'//span[contains(text(),"{country}")]',
-            f'//*[text()="{country}"]'
-        ]
-
-        country_clicked = False
-        for selector in country_selectors:
-            try:
-                sb.wait_for_element_visible(selector, by="xpath", timeout=5)
-                sb.click(selector, by="xpath")
-                country_clicked = True
-                print(f"[SUCCESS] Selected country using selector: {selector}")
-                break
-            except Exception as e:
-                print(f"[DEBUG] Country selector failed: {selector} - {str(e)}")
-                continue
+            logger.error(f"Failed to scrape ads from advertiser {advertiser_name}: {e}")
+            continue
+    return ads
 
-        if not country_clicked:
-            print(f"[ERROR] Could not find country '{country}' with any selector")
-            # Try to get available options for debugging
-            try:
-                available_options = sb.find_elements('//div[contains(@id,"js_")]', by="xpath")
-                print(f"[DEBUG] Available options: {[opt.text for opt in available_options[:10]]}")
-            except:
-                pass
-            raise Exception(f"Could not select country: {country}")
+@contextmanager
+def _helper_browser(sb_kwargs: dict):
+    """
+    A dedicated logged-in browser for an advertiser worker.
 
-        sb.sleep(2)
+    These sit outside BROWSER_POOL, so they are capped separately: at most
+    MAX_HELPER_BROWSERS are alive at once across every running scrape, and
+    a worker waits for a free slot before starting Chrome.
+    """
+    with _HELPER_BROWSERS:
+        with SB(**sb_kwargs) as sb:
+            _login(sb)
+            yield sb
+
+def _scrape_advertisers_in_new_browser(sb_kwargs: dict, country: str, targets: list,
+                                       limit: int, total: int) -> list:
+    """Open a dedicated logged-in browser and scrape a chunk of advertisers."""
+    with _helper_browser(sb_kwargs) as sb:
+        return _scrape_advertisers(sb, country, targets, limit, total)
+
+def _bootstrap(sb, country: str) -> None:
+    """Open the Ad Library search page and apply the country + "All ads" filters."""
+    try:
+        sb.open(AD_LIBRARY_URL)
+        sb.wait_for_ready_state_complete(timeout=10)
+        sb.wait_for_element_visible(_COUNTRY_DROPDOWN_XPATH, by="xpath", timeout=10)
 
-        # 2) Ad category → All ads
-        wait_click(sb, '//div[div/div/text()="Ad category"]/..', by="xpath")
-        wait_click(sb, '//span[text()="All ads"]/../../..', by="xpath")
-        sb.sleep(2)
+    except Exception as e:
+        _log_connection_error(e)
 
-        # ── Extract Suggestions ───────────────────────────────────────────
-        suggestions = extract_suggestions(sb, keyword)
-        print(f"[INFO] Found {len(suggestions)} suggestions for keyword: {keyword}")
+        # Re-raise the exception to be handled by the calling function
+        raise e
 
-    # ── Scrape Advertiser Ads (if requested) ─────────────────────────
-    ads = []
-    if scrape_ads:
-        print(f"[INFO] Starting advertiser ads scraping for {len(suggestions)} suggestions...")
-
-        # Start a new browser session for advertiser ads scraping
-        with SB(uc=True, headless=headless) as sb:
-            # Login bootstrap again
-            print("[INFO] Opening Facebook for advertiser ads scraping...")
-            sb.open("https://facebook.com")
-            print("[INFO] Restoring session cookies...")
-            for ck in load_cookies():
-                try:
-                    if hasattr(sb, 'driver') and sb.driver:
-                        sb.driver.add_cookie(ck)
-                except Exception:
-                    pass
-            sb.open(AD_LIBRARY_URL)
-            sb.sleep(5)
+    # ── Country Selection (EXACT v2 logic) ────────────────────────────
+    logger.info(f"Selecting country: {country}")
 
-            # Iterate through suggestions and scrape ads from each advertiser
-            for idx, suggestion in enumerate(suggestions, 1):
-                page_id = _extract_page_id_from_suggestion(suggestion)
-                if page_id:
-                    try:
-                        advertiser_name = suggestion.get("name", "Unknown")
-                        print(f"[INFO] ({idx}/{len(suggestions)}) Scraping ads from advertiser: {advertiser_name}")
+    # 1) Country dropdown
+    wait_click(sb, _COUNTRY_DROPDOWN_XPATH, by="xpath")
+    safe_type(sb, _COUNTRY_SEARCH_XPATH, country, by="xpath",
+              ready_selector=country_option_xpath(country))
 
-                        # Extract ads from this advertiser with specific limit
-                        ads_from_advertiser = extract_advertiser_ads(
-                            sb, country, page_id, advertiser_name, limit=advertiser_ads_limit
-                        )
+    # One XPath matching every option variant → a single timeout on a miss;
+    # clickable (not just visible) so the click never lands mid-animation
+    country_sel = country_option_xpath(country)
+    try:
+        sb.wait_for_element_clickable(country_sel, by="xpath", timeout=8)
+        sb.click(country_sel, by="xpath")
+        country_clicked = True
+        logger.info(f"Selected country: {country}")
+    except Exception as e:
+        logger.debug("Country selector failed: %s - %s", country_sel, e)
+        country_clicked = False
 
-                        # Add advertiser ads to the main ads list
-                        ads.extend(ads_from_advertiser)
+    if not country_clicked:
+        logger.error(f"Could not find country '{country}' in the dropdown")
+        # Try to get available options for debugging (extra WebDriver calls - DEBUG only)
+        if logger.isEnabledFor(logging.DEBUG):
+            try:
+                available_options = sb.find_elements(_COUNTRY_OPTIONS_XPATH, by="xpath")
+                logger.debug("Available options: %s", [opt.text for opt in available_options[:10]])
+            except:
+                pass
+        raise Exception(f"Could not select country: {country}")
 
-                        print(f"[INFO] Collected {len(ads_from_advertiser)} ads from {advertiser_name}. Total: {len(ads)}")
+    # No fixed pauses below: wait_click waits for the category dropdown and
+    # extract_suggestions for the (enabled) keyword input
+    # 2) Ad category → All ads
+    wait_click(sb, _AD_CATEGORY_XPATH, by="xpath")
+    wait_click(sb, _ALL_ADS_XPATH, by="xpath")
 
-                        # Small delay between advertiser pages
-                        sb.sleep(2)
+@contextmanager
+def _browser(headless: bool = True, proxy: Optional[str] = None):
+    """A fresh logged-in SB browser, for runs that don't use BROWSER_POOL."""
+    sb_kwargs = {"uc": True, "headless": headless}
+    if proxy:
+        sb_kwargs["proxy"] = proxy
+    with SB(**sb_kwargs) as sb:
+        _login(sb)
+        yield sb
+
+def _scrape_suggestion_ads(sb, country: str, suggestions: list, advertiser_ads_limit: int,
+                           headless: bool, proxy_string: Optional[str],
+                           advertiser_concurrency: int) -> list:
+    """Scrape the advertiser pages of ``suggestions``, sharded across browsers."""
+    logger.info(f"Starting advertiser ads scraping for {len(suggestions)} suggestions...")
+
+    # Only suggestions with a real page ID have an advertiser page
+    targets = []
+    for idx, suggestion in enumerate(suggestions, 1):
+        page_id = _extract_page_id_from_suggestion(suggestion)
+        if page_id:
+            targets.append((idx, page_id, suggestion))
+        else:
+            logger.info(f"Skipping suggestion '{suggestion.get('name', 'Unknown')}' - no valid page ID")
 
-                    except Exception as e:
-                        print(f"[ERROR] Failed to scrape ads from advertiser {suggestion.get('name', 'Unknown')}: {e}")
-                        continue
-                else:
-                    print(f"[INFO] Skipping suggestion '{suggestion.get('name', 'Unknown')}' - no valid page ID")
+    # Shard advertisers across browsers: this one takes the first
+    # chunk, each extra worker opens its own logged-in browser
+    workers = max(1, min(advertiser_concurrency, len(targets)))
+    chunks = [targets[i::workers] for i in range(workers)]
+    sb_kwargs = {"uc": True, "headless": headless}
+    if proxy_string:
+        sb_kwargs["proxy"] = proxy_string
 
-            print(f"[INFO] Completed advertiser ads scraping. Total ads collected: {len(ads)}")
+    ads = []
+    with ThreadPoolExecutor(max_workers=max(1, workers - 1)) as executor:
+        futures = [
+            executor.submit(_scrape_advertisers_in_new_browser, sb_kwargs, country,
+                            chunk, advertiser_ads_limit, len(suggestions))
+            for chunk in chunks[1:]
+        ]
+        ads.extend(_scrape_advertisers(sb, country, chunks[0],
+                                       advertiser_ads_limit, len(suggestions)))
+        for future in as_completed(futures):
+            try:
+                ads.extend(future.result())
+            except Exception as e:
+                logger.error(f"Advertiser worker failed: {e}")
 
-    # ── Build nested result object ────────────────────────────────────
-    # Create nested structure: each suggestion with its ads
-    nested_suggestions = []
+    logger.info(f"Completed advertiser ads scraping. Total ads collected: {len(ads)}")
+    return ads
 
+def _build_suggestions_result(country: str, keyword: str, suggestions: list,
+                              ads: list, scrape_ads: bool) -> dict:
+    """Nest ads under their suggestions, save the record and return it."""
+    # Create nested structure in place: each suggestion with its ads
+    # (suggestions isn't used again, so no per-suggestion copy is needed)
     if scrape_ads:
-        # Group ads by advertiser and create nested structure
-        for suggestion in suggestions:
-            suggestion_copy = suggestion.copy()
-            page_id = _extract_page_id_from_suggestion(suggestion)
-            advertiser_name = suggestion.get("name", "Unknown")
+        # Group ads by advertiser once, then look each suggestion up
+        ads_by_advertiser = defaultdict(list)
+        for ad in ads:
+            ads_by_advertiser[ad.get("scraped_from_advertiser")].append(ad)
 
-            # Find ads for this specific advertiser
-            advertiser_ads = [ad for ad in ads if ad.get("scraped_from_advertiser") == advertiser_name]
-
-            # Add ads to the suggestion
-            suggestion_copy["ads"] = advertiser_ads
-            suggestion_copy["ads_count"] = len(advertiser_ads)
-
-            nested_suggestions.append(suggestion_copy)
+        for suggestion in suggestions:
+            suggestion["ads"] = ads_by_advertiser.get(suggestion.get("name", "Unknown"), [])
+            suggestion["ads_count"] = len(suggestion["ads"])
     else:
         # If not scraping ads, just add empty ads array to each suggestion
         for suggestion in suggestions:
-            suggestion_copy = suggestion.copy()
-            suggestion_copy["ads"] = []
-            suggestion_copy["ads_count"] = 0
-            nested_suggestions.append(suggestion_copy)
+            suggestion["ads"] = []
+            suggestion["ads_count"] = 0
+
+    nested_suggestions = suggestions
 
     result = {
         "country": country,
@@ -615,11 +792,102 @@ def scrape_suggestions_sync(country: str, keyword: str, scrape_ads: bool = False
     # ── Save data immediately to Results directory ─────────────────────
     save_data_to_results(result)
 
-    print(f"[INFO] Completed scraping for {country} | {keyword}")
-    print(f"[INFO] Results: {len(nested_suggestions)} suggestions, {len(ads) if scrape_ads else 0} ads")
-
+    logger.info(f"Completed scraping for {country} | {keyword}")
+    logger.info(f"Results: {len(nested_suggestions)} suggestions, {len(ads) if scrape_ads else 0} ads")
     return result
 
+def scrape_keywords_sync(country: str, keywords: List[str], scrape_ads: bool = False,
+                         advertiser_ads_limit: int = 100, headless: bool = True,
+                         advertiser_concurrency: int = ADVERTISER_CONCURRENCY) -> List[dict]:
+    """
+    Scrape several keywords for one country in a single browser session.
+
+    The country / category filters are applied once and each keyword is typed
+    into the same search box. Advertiser scraping navigates away, so the page
+    is bootstrapped again before the next keyword in that case.
+
+    Returns:
+        One result dict per keyword that succeeded (raises if none did)
+    """
+    logger.info(f"Starting suggestions scraping for: {country} | {', '.join(keywords)}")
+
+    # Get proxy configuration
+    proxy_string = get_proxy_string_with_fallback()
+    if proxy_string:
+        logger.info(f"Using proxy: {proxy_string.split('@')[-1] if '@' in proxy_string else proxy_string}")
+    else:
+        logger.info("No proxy available, running without proxy")
+
+    # Fail fast on DNS / proxy problems before paying for a browser start
+    _preflight(proxy_string)
+
+    results: List[dict] = []
+    errors: List[Exception] = []
+
+    # Pooled, already logged-in browser (with or without proxy)
+    try:
+        with BROWSER_POOL.acquire(headless=headless, proxy=proxy_string) as sb:
+            needs_bootstrap = True
+            for keyword in keywords:
+                try:
+                    if needs_bootstrap:
+                        _bootstrap(sb, country)
+                        needs_bootstrap = False
+
+                    # ── Extract Suggestions ───────────────────────────────
+                    suggestions = extract_suggestions(sb, keyword)
+                    logger.info(f"Found {len(suggestions)} suggestions for keyword: {keyword}")
+
+                    # ── Scrape Advertiser Ads (if requested) ─────────────
+                    # Same browser session: cookies are already restored, no second login
+                    ads = []
+                    if scrape_ads:
+                        needs_bootstrap = True
+                        ads = _scrape_suggestion_ads(sb, country, suggestions, advertiser_ads_limit,
+                                                     headless, proxy_string, advertiser_concurrency)
+
+                    results.append(_build_suggestions_result(country, keyword, suggestions, ads, scrape_ads))
+
+                except Exception as e:
+                    logger.error(f"Scraping failed for {country} | {keyword}: {e}")
+                    errors.append(e)
+                    needs_bootstrap = True      # page state unknown, start over
+                    if not _driver_alive(sb):
+                        # Crashed / disconnected Chrome: leave the block with an
+                        # exception so the pool closes this slot's browser
+                        raise _BrowserGone() from e
+    except _BrowserGone:
+        skipped = keywords[len(results) + len(errors):]
+        if skipped:
+            logger.error(f"Browser died, skipping {country} | {', '.join(skipped)}")
+
+    _log_buffer.flush()
+
+    # Nothing succeeded - surface the failure to the caller
+    if errors and not results:
+        raise errors[0]
+    return results
+
+def scrape_suggestions_sync(country: str, keyword: str, scrape_ads: bool = False,
+                           advertiser_ads_limit: int = 100, headless: bool = True,
+                           advertiser_concurrency: int = ADVERTISER_CONCURRENCY) -> dict:
+    """
+    Main suggestions scraping function - exact v2 logic.
+
+    Args:
+        country: Country to scrape from
+        keyword: Keyword to search for
+        scrape_ads: Whether to also scrape ads from each advertiser found
+        advertiser_ads_limit: Maximum number of ads to extract per advertiser page
+        headless: Whether to run in headless mode
+        advertiser_concurrency: Browsers used in parallel for advertiser pages
+
+    Returns:
+        Dictionary with suggestions and optionally ads data
+    """
+    return scrape_keywords_sync(country, [keyword], scrape_ads, advertiser_ads_limit,
+                                headless, advertiser_concurrency)[0]
+
 
 class SuggestionsScraperAPI:
     """API wrapper class for suggestions scraping functionality."""
@@ -630,7 +898,8 @@ class SuggestionsScraperAPI:
     async def scrape_suggestions(self, target_pairs: List[List[str]],
                                scrape_advertiser_ads: bool = False,
                                headless: bool = True,
-                               advertiser_ads_limit: int = 100) -> Dict[str, Any]:
+                               advertiser_ads_limit: int = 100,
+                               max_concurrency: int = MAX_CONCURRENCY) -> Dict[str, Any]:
         """
         Async wrapper for suggestions scraping.
 
@@ -639,27 +908,49 @@ class SuggestionsScraperAPI:
             scrape_advertiser_ads: Whether to also scrape ads from each advertiser found
             headless: Whether to run in headless mode
             advertiser_ads_limit: Maximum number of ads to extract per advertiser page
+            max_concurrency: Maximum number of pairs (browsers) scraped at the same time
 
         Returns:
             Dictionary with suggestions and optionally ads data
         """
-        # Run the synchronous scraper in a thread pool
-        loop = asyncio.get_event_loop()
+        # Pairs sharing a country reuse one browser and one country / category
+        # bootstrap; the groups run in a thread pool, several at once
+        by_country: Dict[str, List[str]] = {}
+        for country, keyword in target_pairs:
+            by_country.setdefault(country, []).append(keyword)
+
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _scrape_group(country: str, keywords: List[str]) -> List[dict]:
+            async with semaphore:
+                return await loop.run_in_executor(
+                    _SCRAPE_EXECUTOR,
+                    scrape_keywords_sync,
+                    country,
+                    keywords,
+                    scrape_advertiser_ads,
+                    advertiser_ads_limit,
+                    headless
+                )
+
+        group_results = await asyncio.gather(
+            *[_scrape_group(country, keywords) for country, keywords in by_country.items()],
+            return_exceptions=True
+        )
 
         all_results = []
+        errors = []
+        for (country, keywords), result in zip(by_country.items(), group_results):
+            if isinstance(result, BaseException):
+                logger.error(f"Scraping failed for {country} | {', '.join(keywords)}: {result}")
+                errors.append(result)
+            else:
+                all_results.extend(result)
 
-        for country, keyword in target_pairs:
-            # Use run_in_executor to run the sync function in a thread
-            result = await loop.run_in_executor(
-                None,
-                scrape_suggestions_sync,
-                country,
-                keyword,
-                scrape_advertiser_ads,
-                advertiser_ads_limit,
-                headless
-            )
-            all_results.append(result)
+        # Nothing succeeded - surface the failure to the caller like before
+        if errors and not all_results:
+            raise errors[0]
 
         # Combine all results
         combined_result = {
@@ -668,86 +959,231 @@ class SuggestionsScraperAPI:
             "timestamp": datetime.now().isoformat(),
         }
 
+        # Fold this run's JSON Lines records into Results/suggestions.json
+        flush_to_json()
+
         return combined_result
 
-    def save_separate_files(self, result: Dict[str, Any]) -> Dict[str, str]:
+    async def save_separate_files(self, result: Dict[str, Any]) -> Dict[str, str]:
         """
         Save different data types to separate files.
 
+        All files are serialized with orjson and written concurrently via aiofiles.
+
         Args:
             result: The scraping result dictionary
 
         Returns:
             Dictionary with file paths for each data type
         """
-        files_saved = {}
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        payloads: Dict[str, Any] = {"suggestions": result}
 
-        # Save full results
-        suggestions_file = self.output_dir / f"suggestions_{timestamp}.json"
-        suggestions_file.write_text(
-            json.dumps(result, indent=2, ensure_ascii=False),
-            encoding="utf-8"
-        )
-        files_saved["suggestions"] = str(suggestions_file)
-
-        # Extract and save individual data types
-        all_suggestions = []
+        # Extract individual data types in a single pass over the results
         all_pages = []
         all_ads = []
 
         for pair_result in result.get("results", []):
-            # Collect suggestions
-            suggestions = pair_result.get("suggestions", [])
-            all_suggestions.extend(suggestions)
+            # Per-pair fields are the same for each of its suggestions
+            country = pair_result.get("country", "")
+            keyword = pair_result.get("keyword", "")
+            pair_timestamp = pair_result.get("timestamp", "")
 
             # Extract pages data from suggestions
-            for suggestion in suggestions:
-                page_data = {
+            all_pages.extend(
+                {
                     "page_id": suggestion.get("page_id", ""),
                     "name": suggestion.get("name", ""),
                     "raw_text": suggestion.get("raw_text", ""),
-                    "country": pair_result.get("country", ""),
-                    "keyword": pair_result.get("keyword", ""),
-                    "timestamp": pair_result.get("timestamp", ""),
+                    "country": country,
+                    "keyword": keyword,
+                    "timestamp": pair_timestamp,
                 }
-                all_pages.append(page_data)
+                for suggestion in pair_result.get("suggestions", [])
+            )
 
             # Collect ads if any
             ads = pair_result.get("ads", [])
             all_ads.extend(ads)
 
-        # Save pages data
         if all_pages:
-            pages_file = self.output_dir / f"pages_{timestamp}.json"
-            pages_file.write_text(
-                json.dumps(all_pages, indent=2, ensure_ascii=False),
-                encoding="utf-8"
-            )
-            files_saved["pages"] = str(pages_file)
+            payloads["pages"] = all_pages
 
-        # Save ads data
         if all_ads:
-            ads_file = self.output_dir / f"ads_{timestamp}.json"
-            ads_file.write_text(
-                json.dumps(all_ads, indent=2, ensure_ascii=False),
-                encoding="utf-8"
-            )
-            files_saved["ads"] = str(ads_file)
+            payloads["ads"] = all_ads
 
-            # Save advertiser ads data separately
-            advertiser_ads = [ad for ad in all_ads if ad.get("advertiser_context", {}).get("scraped_from") == "advertiser_page"]
+            # Advertiser ads are also saved separately
+            advertiser_ads = [
+                ad for ad in all_ads
+                if (context := ad.get("advertiser_context")) and context.get("scraped_from") == "advertiser_page"
+            ]
             if advertiser_ads:
-                advertiser_ads_file = self.output_dir / f"advertiser_ads_{timestamp}.json"
-                advertiser_ads_file.write_text(
-                    json.dumps(advertiser_ads, indent=2, ensure_ascii=False),
-                    encoding="utf-8"
-                )
-                files_saved["advertiser_ads"] = str(advertiser_ads_file)
+                payloads["advertiser_ads"] = advertiser_ads
+
+        files_saved = {
+            name: str(self.output_dir / f"{name}_{timestamp}.json") for name in payloads
+        }
+
+        async def _write(path: str, data: Any) -> None:
+            async with aiofiles.open(path, "wb") as f:
+                await f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
+        await asyncio.gather(*[_write(files_saved[name], data) for name, data in payloads.items()])
         return files_saved
 
-def scrape_suggestions_with_ads_sync(country: str, keyword: str, max_scrolls: int = 10, headless: bool = True) -> dict:
+def _build_adv(suggestion: Dict[str, Any], name: str, page_id: str, ads: list) -> Dict[str, Any]:
+    """Nested advertiser record used in the unified scrape results."""
+    return {
+        "advertiser": {
+            "name": name,
+            "page_id": page_id,
+            "description": suggestion.get("description", ""),
+            "raw_text": suggestion.get("raw_text", ""),
+            "ads": ads
+        }
+    }
+
+def scrape_advertiser(sb, suggestion: Dict[str, Any], country: str,
+                      idx: int = 1, total: int = 1, preloaded: bool = False) -> Dict[str, Any]:
+    """Open one advertiser's ads page and return its nested advertiser record.
+
+    With ``preloaded`` the current tab already holds the advertiser page
+    (see _open_advertiser_tab) and only the scroll / extract part runs.
+    """
+    advertiser_name = suggestion.get("name", "").strip()
+    logger.info(f"({idx}/{total}) Scraping ads for: {advertiser_name}")
+
+    # Advertisers without a page or whose scrape fails are kept without ads
+    page_id = ""
+    filtered_ads: list = []
+    try:
+        # Extract page_id from suggestion
+        page_id = _extract_page_id_from_suggestion(suggestion) or ""
+
+        if page_id:
+            # Build URL for this advertiser's ads
+            advertiser_url = _build_advertiser_url(country, page_id)
+
+            # Navigate to advertiser's ads page
+            if not preloaded:
+                sb.open(advertiser_url)
+            _wait_for_more_cards(sb, 0, timeout=10)
+
+            # Scroll to load ads, moving on once the network and DOM go quiet
+            for i in range(3):
+                human_scroll(sb)
+                _wait_for_settle(sb, timeout=2 + i * 0.5)
+
+            # Extract ads from the page
+            ads = extract_ads(sb, limit=100)  # Default limit since we use scroll-based approach
+
+            # Filter ads to only include those from this specific advertiser
+            target_norm = _nfkd_fold(advertiser_name)
+            filtered_ads = [ad for ad in ads if ad.get("page") and _nfkd_fold(ad["page"]) == target_norm]
+
+            logger.info(f"Found {len(filtered_ads)} ads for {advertiser_name}")
+        else:
+            logger.warning(f"No valid page_id found for {advertiser_name}")
+
+    except Exception as e:
+        logger.error(f"Failed to scrape ads for {advertiser_name}: {str(e)}")
+        page_id = suggestion.get("page_id", "")
+        filtered_ads = []
+
+    return _build_adv(suggestion, advertiser_name, page_id, filtered_ads)
+
+def _open_advertiser_tab(sb, country: str, suggestion: Dict[str, Any]) -> Optional[str]:
+    """Start loading an advertiser's ads page in a background tab.
+
+    Returns the new window handle, or None when there is no page to load.
+    """
+    page_id = _extract_page_id_from_suggestion(suggestion)
+    if not page_id:
+        return None
+    driver = sb.driver
+    before = set(driver.window_handles)
+    # window.open doesn't block on the load the way driver.get does
+    driver.execute_script("window.open(arguments[0], '_blank');",
+                          _build_advertiser_url(country, page_id))
+    opened = [h for h in driver.window_handles if h not in before]
+    return opened[0] if opened else None
+
+def _drain_advertisers(sb, country: str, work: queue.Queue, results: list, total: int,
+                       max_items: Optional[int] = None, tabs: int = ADVERTISER_TABS) -> bool:
+    """
+    Scrape queued (idx, suggestion) items in one browser.
+
+    Up to ``tabs`` advertiser pages load ahead in background tabs while the
+    current one is scrolled and parsed; each tab is closed once scraped.
+    Stops after ``max_items`` advertisers; returns True once the queue is empty.
+    """
+    driver = sb.driver
+    main_handle = driver.current_window_handle
+    pending: deque = deque()                    # (idx, suggestion, tab handle or None)
+    queue_empty = False
+    done = 0
+    try:
+        while True:
+            # Keep the pipeline of loading tabs full
+            while (not queue_empty and len(pending) < tabs
+                   and (max_items is None or done + len(pending) < max_items)):
+                try:
+                    idx, suggestion = work.get_nowait()
+                except queue.Empty:
+                    queue_empty = True
+                    break
+                try:
+                    handle = _open_advertiser_tab(sb, country, suggestion)
+                except Exception as e:
+                    logger.debug("Could not open a tab for %s: %s", suggestion.get('name', ''), e)
+                    handle = None
+                pending.append((idx, suggestion, handle))
+
+            if not pending:
+                break
+
+            # Without a tab, scrape_advertiser navigates the main tab itself
+            idx, suggestion, handle = pending.popleft()
+            if handle:
+                driver.switch_to.window(handle)
+            results.append((idx, scrape_advertiser(sb, suggestion, country, idx, total,
+                                                   preloaded=handle is not None)))
+            _log_buffer.flush()
+            done += 1
+            if handle:
+                driver.close()
+                driver.switch_to.window(main_handle)
+    finally:
+        # Hand unscraped items back (e.g. after a browser crash) and close their tabs
+        for idx, suggestion, handle in pending:
+            work.put((idx, suggestion))
+            if handle:
+                try:
+                    driver.switch_to.window(handle)
+                    driver.close()
+                except Exception:
+                    pass
+        try:
+            driver.switch_to.window(main_handle)
+        except Exception:
+            pass
+    return queue_empty or work.empty()
+
+def _drain_advertisers_in_new_browser(sb_kwargs: dict, country: str, work: queue.Queue,
+                                      results: list, total: int,
+                                      per_browser: int = ADVERTISERS_PER_BROWSER) -> None:
+    """
+    Help drain the advertiser queue with dedicated logged-in browsers,
+    restarting the browser every ``per_browser`` advertisers to keep
+    memory and lookup times flat on long runs.
+    """
+    while not work.empty():
+        with _helper_browser(sb_kwargs) as sb:
+            if _drain_advertisers(sb, country, work, results, total, max_items=per_browser):
+                return
+
+def scrape_suggestions_with_ads_sync(country: str, keyword: str, max_scrolls: int = 10, headless: bool = True,
+                                     advertiser_concurrency: int = ADVERTISER_CONCURRENCY) -> dict:
     """
     Unified scraping function that gets suggestions and ads for each advertiser.
 
@@ -756,170 +1192,155 @@ def scrape_suggestions_with_ads_sync(country: str, keyword: str, max_scrolls: in
         keyword: Keyword to search for
         max_scrolls: Maximum number of scrolls when scraping advertiser ads
         headless: Whether to run in headless mode
+        advertiser_concurrency: Browsers scraping advertiser pages in parallel
 
     Returns:
         Dictionary with suggestions and ads data in nested structure
     """
-    print(f"[INFO] Starting unified scraping for: {country} | {keyword}")
-
-    with SB(uc=True, headless=headless) as sb:
-        # ── Login bootstrap ───────────────────────────────────────────────
-        print("[INFO] Opening Facebook...")
-        sb.open("https://facebook.com")
-        print("[INFO] Restoring session cookies...")
-        for ck in load_cookies():
-            try:
-                sb.driver.add_cookie(ck)
-            except Exception:
-                pass
-        sb.open(AD_LIBRARY_URL)
-        sb.sleep(5)
-
-        # ── Country Selection ─────────────────────────────────────────────
-        print(f"[INFO] Selecting country: {country}")
-
-        # Country dropdown
-        wait_click(sb, '//div[div/div/text()="All" or div/div/text()="Country"]/..', by="xpath")
-        safe_type(sb, '//input[@placeholder="Search for country"]', country, by="xpath")
-
-        # Country selection with fallback selectors
-        country_selectors = [
-            f'//div[contains(@id,"js_") and text()="{country}"]',
-            f'//div[contains(@id,"js_") and contains(text(),"{country}")]',
-            f'//div[text()="{country}"]',
-            f'//div[contains(text(),"{country}")]',
-            f'//span[text()="{country}"]',
-            f'//span[contains(text(),"{country}")]',
-            f'//*[text()="{country}"]'
-        ]
+    logger.info(f"Starting unified scraping for: {country} | {keyword}")
 
-        country_clicked = False
-        for selector in country_selectors:
+    sb_kwargs = {"uc": True, "headless": headless}
+    work: queue.Queue = queue.Queue()
+    results: list = []                          # (idx, advertiser_data); list.append is atomic
+    executor = None
+    futures = []
+    try:
+        with _browser(headless) as sb:
+            # Same login / country / category bootstrap as scrape_keywords_sync
+            _bootstrap(sb, country)
+
+            # ── Extract Suggestions ───────────────────────────────────────
+            suggestions = extract_suggestions(sb, keyword)
+            logger.info(f"Found {len(suggestions)} suggestions for keyword: {keyword}")
+
+            # ── Scrape Ads for Each Advertiser ───────────────────────────
+            # This browser plus (advertiser_concurrency - 1) extra logged-in
+            # browsers pull advertisers from a shared queue
+            for idx, suggestion in enumerate(suggestions, 1):
+                if suggestion.get("name", "").strip():
+                    work.put((idx, suggestion))
+
+            extra_workers = max(0, min(advertiser_concurrency, work.qsize()) - 1)
+            executor = ThreadPoolExecutor(max_workers=max(1, extra_workers))
+            futures = [
+                executor.submit(_drain_advertisers_in_new_browser, sb_kwargs,
+                                country, work, results, len(suggestions))
+                for _ in range(extra_workers)
+            ]
+            queue_empty = _drain_advertisers(sb, country, work, results, len(suggestions),
+                                             max_items=ADVERTISERS_PER_BROWSER)
+
+        # The bootstrap browser is closed after its first batch; this thread
+        # keeps helping with fresh browsers that are recycled periodically
+        if not queue_empty:
+            _drain_advertisers_in_new_browser(sb_kwargs, country, work, results, len(suggestions))
+        for future in as_completed(futures):
             try:
-                sb.wait_for_element_visible(selector, by="xpath", timeout=5)
-                sb.click(selector, by="xpath")
-                country_clicked = True
-                print(f"[SUCCESS] Selected country using selector: {selector}")
-                break
+                future.result()
             except Exception as e:
-                print(f"[DEBUG] Country selector failed: {selector} - {str(e)}")
-                continue
+                logger.error(f"Advertiser worker failed: {e}")
 
-        if not country_clicked:
-            print(f"[ERROR] Could not find country '{country}' with any selector")
-            raise Exception(f"Could not select country: {country}")
+        # A worker whose browser died hands its pending advertisers back to
+        # the queue, possibly after everyone else stopped: one more pass,
+        # then keep any leftovers without ads like other failed advertisers
+        if not work.empty():
+            try:
+                _drain_advertisers_in_new_browser(sb_kwargs, country, work, results, len(suggestions))
+            except Exception as e:
+                logger.error(f"Retrying requeued advertisers failed: {e}")
+        while True:
+            try:
+                idx, suggestion = work.get_nowait()
+            except queue.Empty:
+                break
+            name = suggestion.get("name", "").strip()
+            logger.error(f"Advertiser {name} could not be scraped, keeping it without ads")
+            results.append((idx, _build_adv(suggestion, name, suggestion.get("page_id", ""), [])))
+    except BaseException:
+        # Drop the remaining advertisers so the workers stop after their
+        # current page instead of draining the whole queue
+        while True:
+            try:
+                work.get_nowait()
+            except queue.Empty:
+                break
+        raise
+    finally:
+        # Join the workers (and close their browsers) on every exit path
+        if executor is not None:
+            executor.shutdown(wait=True)
 
-        sb.sleep(2)
+    # Keep the original suggestion order
+    nested_suggestions = [data for _, data in sorted(results, key=lambda r: r[0])]
 
-        # Ad category → All ads
-        wait_click(sb, '//div[div/div/text()="Ad category"]/..', by="xpath")
-        wait_click(sb, '//span[text()="All ads"]/../../..', by="xpath")
-        sb.sleep(2)
+    # ── Build Final Result ────────────────────────────────────────────
+    result = {
+        "keyword": keyword,
+        "country": country,
+        "timestamp": datetime.now().isoformat(),
+        "suggestions": nested_suggestions
+    }
 
-        # ── Extract Suggestions ───────────────────────────────────────────
-        suggestions = extract_suggestions(sb, keyword)
-        print(f"[INFO] Found {len(suggestions)} suggestions for keyword: {keyword}")
+    logger.info(f"Completed unified scraping for {country} | {keyword}")
+    logger.info(f"Results: {len(nested_suggestions)} advertisers with ads")
 
-        # ── Scrape Ads for Each Advertiser ───────────────────────────────
-        nested_suggestions = []
+    _log_buffer.flush()
+    return result
 
-        for idx, suggestion in enumerate(suggestions, 1):
-            advertiser_name = suggestion.get("name", "").strip()
-            if not advertiser_name:
-                continue
+@lru_cache(maxsize=4096)
+def _nfkd_fold(s: str) -> str:
+    """Unicode-normalised, case-folded form of a page name (memoised)."""
+    return unicodedata.normalize("NFKD", s).casefold()
 
-            print(f"[INFO] ({idx}/{len(suggestions)}) Scraping ads for: {advertiser_name}")
+def human_scroll(sb: SB, px: int = 1800):
+    """Human-like scrolling"""
+    sb.execute_script(f"window.scrollBy(0,{px});")
 
-            try:
-                # Extract page_id from suggestion
-                page_id = _extract_page_id_from_suggestion(suggestion)
-
-                if page_id:
-                    # Build URL for this advertiser's ads
-                    advertiser_url = _build_advertiser_url(country, page_id)
-
-                    # Navigate to advertiser's ads page
-                    sb.open(advertiser_url)
-                    sb.sleep(4)
-
-                    # Scroll to load ads
-                    for i in range(3):
-                        human_scroll(sb)
-                        sb.sleep(2 + i * 0.5)
-
-                    # Extract ads from the page
-                    ads = extract_ads(sb, limit=100)  # Default limit since we use scroll-based approach
-
-                    # Filter ads to only include those from this specific advertiser
-                    filtered_ads = [ad for ad in ads if _match_page(ad.get("page"), advertiser_name)]
-
-                    print(f"[INFO] Found {len(filtered_ads)} ads for {advertiser_name}")
-
-                    # Build nested structure
-                    advertiser_data = {
-                        "advertiser": {
-                            "name": advertiser_name,
-                            "page_id": page_id,
-                            "description": suggestion.get("description", ""),
-                            "raw_text": suggestion.get("raw_text", ""),
-                            "ads": filtered_ads
-                        }
-                    }
-
-                    nested_suggestions.append(advertiser_data)
-
-                else:
-                    print(f"[WARNING] No valid page_id found for {advertiser_name}")
-                    # Still add the advertiser without ads
-                    advertiser_data = {
-                        "advertiser": {
-                            "name": advertiser_name,
-                            "page_id": "",
-                            "description": suggestion.get("description", ""),
-                            "raw_text": suggestion.get("raw_text", ""),
-                            "ads": []
-                        }
-                    }
-                    nested_suggestions.append(advertiser_data)
+# Any card in any month strip; only used to notice that more cards loaded
+_ANY_CARD_XPATH = f"{MONTH_BASE}/div/div[position()=3 or position()=4]/div[1]/div/div[1]"
+_COUNT_XPATH_JS = ("return document.evaluate(arguments[0], document, null, "
+                   "XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;")
 
-            except Exception as e:
-                print(f"[ERROR] Failed to scrape ads for {advertiser_name}: {str(e)}")
-                # Still add the advertiser without ads
-                advertiser_data = {
-                    "advertiser": {
-                        "name": advertiser_name,
-                        "page_id": suggestion.get("page_id", ""),
-                        "description": suggestion.get("description", ""),
-                        "raw_text": suggestion.get("raw_text", ""),
-                        "ads": []
-                    }
-                }
-                nested_suggestions.append(advertiser_data)
+def _card_count(driver) -> int:
+    """Number of ad cards currently in the DOM (one round-trip, no elements sent)."""
+    return driver.execute_script(_COUNT_XPATH_JS, _ANY_CARD_XPATH) or 0
 
-        # ── Build Final Result ────────────────────────────────────────────
-        result = {
-            "keyword": keyword,
-            "country": country,
-            "timestamp": datetime.now().isoformat(),
-            "suggestions": nested_suggestions
-        }
+def _wait_for_more_cards(sb, baseline: int, timeout: float) -> bool:
+    """Wait until the card count exceeds *baseline*; False on timeout."""
+    try:
+        WebDriverWait(sb.driver, timeout, poll_frequency=0.15).until(
+            lambda d: _card_count(d) > baseline
+        )
+        return True
+    except TimeoutException:
+        return False
 
-        print(f"[INFO] Completed unified scraping for {country} | {keyword}")
-        print(f"[INFO] Results: {len(nested_suggestions)} advertisers with ads")
+# Resource requests issued so far and cards present: unchanged = page is idle
+_ACTIVITY_JS = ("return [performance.getEntriesByType('resource').length, "
+                "document.evaluate(arguments[0], document, null, "
+                "XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength];")
 
-        return result
+def _wait_for_settle(sb, timeout: float, quiet: float = 0.5) -> None:
+    """
+    Wait until no new network requests or cards appear for ``quiet`` seconds
+    (capped at ``timeout``). Falls back to a plain sleep if the probe fails.
+    """
+    state = {"last": None, "since": time.monotonic()}
 
-def _match_page(page: str | None, target: str) -> bool:
-    """Case-insensitive, unicode-normalised equality test."""
-    if not page:
-        return False
-    import unicodedata
-    return unicodedata.normalize("NFKD", page).casefold() == \
-           unicodedata.normalize("NFKD", target).casefold()
+    def _idle(driver) -> bool:
+        now = time.monotonic()
+        activity = driver.execute_script(_ACTIVITY_JS, _ANY_CARD_XPATH)
+        if activity != state["last"]:
+            state["last"], state["since"] = activity, now
+            return False
+        return now - state["since"] >= quiet
 
-def human_scroll(sb: SB, px: int = 1800):
-    """Human-like scrolling"""
-    sb.execute_script(f"window.scrollBy(0,{px});")
+    try:
+        WebDriverWait(sb.driver, timeout, poll_frequency=0.1).until(_idle)
+    except TimeoutException:
+        pass
+    except Exception:
+        sb.sleep(timeout)
 
 def extract_ads(sb, limit: int | None = None) -> list[dict[str, Any]]:
     """
@@ -935,204 +1356,264 @@ def extract_ads(sb, limit: int | None = None) -> list[dict[str, Any]]:
 
     # nudge page so FB injects first batch
     sb.execute_script("window.scrollBy(0,600);")
-    time.sleep(1)
+    _wait_for_more_cards(sb, 0, timeout=3)
 
-    print("[INFO] Month-aware scraping starts…")
+    logger.debug("Month-aware scraping starts…")
 
     while True:
+        if limit and len(ads) >= limit:
+            logger.info(f"Hit ads limit {limit}.")
+            return ads
+
         # ── 1. find every month strip currently present
         prefixes = _discover_month_prefixes(sb)
 
-        # ── 2. compute *total* cards now in DOM
-        total_now = sum(_count_cards_in_prefix(p, sb) for p in prefixes)
+        # ── 2. fetch every card now in DOM (document order = strip order),
+        #       but never more than the limit still needs
+        cards_xpath = " | ".join(f"{p}/div/div[1]" for p in prefixes)
+        if cards_xpath and limit:
+            cards_xpath = f"({cards_xpath})[position() <= {seen_cards + limit - len(ads)}]"
+        all_cards = sb.driver.find_elements("xpath", cards_xpath) if cards_xpath else []
+        total_now = len(all_cards)
 
         if total_now > seen_cards:
-            # Parse only the *new* tail in each strip
-            print(f"[INFO] New cards detected: {total_now-seen_cards} (total {total_now})")
+            # Parse only the *new* tail
+            logger.debug("New cards detected: %s (total %s)", total_now-seen_cards, total_now)
             parsed_this_round = 0
-            cumulative = 0    # running count across prefixes (newest → oldest)
-
-            for prefix in prefixes:
-                n_cards = _count_cards_in_prefix(prefix, sb)
-                # how many of those have we already parsed inside this strip?
-                already = max(0, seen_cards - cumulative)
-                cumulative += n_cards
-
-                for idx in range(already + 1, n_cards + 1):
-                    if limit and len(ads) >= limit:
-                        print(f"[INFO] Hit ads limit {limit}.")
-                        return ads
-                    try:
-                        card = sb.driver.find_element("xpath", f"{prefix}/div[{idx}]/div")
-                        ads.append(_parse_card(card))
-                        # print(f" ads data {ads[-1]}")
-                        parsed_this_round += 1
-                    except Exception as e:
-                        print(f"[WARN] failed to parse card {idx} in {prefix}: {e}")
+
+            new_cards = all_cards[seen_cards:]
+            if limit:
+                new_cards = new_cards[:max(0, limit - len(ads))]
+
+            # One round-trip for the whole batch
+            try:
+                records = _parse_cards(sb.driver, new_cards)
+            except Exception as e:
+                logger.warning(f"failed to parse cards {seen_cards + 1}-{total_now}: {e}")
+                records = []
+
+            for idx, record in enumerate(records, seen_cards + 1):
+                if record is None:
+                    logger.warning(f"failed to parse card {idx}")
+                    continue
+                ads.append(record)
+                parsed_this_round += 1
+
+            if limit and len(ads) >= limit:
+                logger.info(f"Hit ads limit {limit}.")
+                return ads
 
             seen_cards = total_now
             dead_scrolls = 0
-            print(f"[INFO] Parsed {parsed_this_round} new ads (running total {len(ads)}).")
+            logger.debug("Parsed %s new ads (running total %s).", parsed_this_round, len(ads))
 
         else:
             dead_scrolls += 1
             if dead_scrolls >= MAX_DEAD:
-                print("[INFO] No new cards after several scrolls – finishing.")
+                logger.info("No new cards after several scrolls – finishing.")
                 return ads
 
-        # ── 3. scroll one viewport further
-        sb.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(1.2)
+        # ── 3. bring the last card into view so FB's lazy loader fires
+        before = _card_count(sb.driver)
+        if all_cards:
+            try:
+                sb.driver.execute_script(
+                    "arguments[0].scrollIntoView({block: 'end', behavior: 'instant'});", all_cards[-1]
+                )
+            except Exception:
+                sb.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        else:
+            sb.execute_script("window.scrollBy(0, 1800);")
+        _wait_for_more_cards(sb, before, timeout=3)   # a miss counts as a dead scroll
+
+# Walks month strips div[2], div[3], … inside the page (one round-trip).
+# latest month => /div[4]/div[1]   |   older months => /div[3]/div[1]
+_MONTH_PREFIXES_JS = """
+const base = arguments[0], prefixes = [];
+const has = (xp) => document.evaluate(
+    xp, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue !== null;
+for (let m = 2; ; m++) {
+    let found = null;
+    for (const inner of [4, 3]) {
+        const prefix = `${base}/div[${m}]/div[${inner}]/div[1]`;
+        if (has(`${prefix}/div[1]/div`)) { found = prefix; break; }
+    }
+    if (!found) break;                     // no more month sections
+    prefixes.push(found);
+}
+return prefixes;
+"""
 
 def _discover_month_prefixes(sb) -> list[str]:
     """
     Return *all* month-strip prefixes currently in the DOM.
     Order: newest first, then older and older…  (Good for parsing tail-first.)
     """
-    prefixes: list[str] = []
-    m = 2                                      # first month = div[2]
-    while True:
-        month_base = f"{MONTH_BASE}/div[{m}]"
-        found = None
+    return list(sb.execute_script(_MONTH_PREFIXES_JS, MONTH_BASE) or [])
+
+
+# ── Card parsing patterns (compiled once) ───────────────────────────────────
+_LINK_LINE_RE = re.compile(r"https?://|^[A-Z0-9._%+-]+\.[A-Z]{2,}$", re.I)
+_CTA_LINE_RE = re.compile(r"^\w.*\b(?:Shop|Learn|Contact|Apply|Sign)\b")
+CTA_PHRASES = (
+    "\nLearn More", "\nLearn more", "\nShop Now", "\nShop now", "\nBook Now",
+    "\nBook now", "\nDonate", "\nDonate now", "\nApply Now", "\nApply now",
+    "\nGet offer", "\nGet Offer", "\nGet quote", "\nSign Up", "\nSign up",
+    "\nContact us", "\nSend message", "\nSend Message", "\nSubscribe", "\nRead more","\nSend WhatsApp message",
+    "\nSend WhatsApp Message", "\nWatch video", "\nWatch Video",
+)
+# Phrases only count at the start of a line (their leading "\n"), not mid-sentence
+_CTA_RE = re.compile(r"(?m)^(" + "|".join(re.escape(p.lstrip()) for p in CTA_PHRASES) + r")\b")
+# Every CTA probe fused into one XPath: footer button/span whose text is a phrase
+_CTA_XPATH = (
+    ".//*[self::div[@role='button'] or self::span]["
+    + " or ".join(f'normalize-space(text())="{p.lstrip()}"' for p in CTA_PHRASES)
+    + "]"
+)
 
-        # latest month => /div[4]/div[1]   |   older months => /div[3]/div[1]
-        for inner in (4, 3):
-            prefix = f"{month_base}/div[{inner}]/div[1]"
-            try:
-                sb.driver.find_element("xpath", f"{prefix}/div[1]/div")
-                found = prefix
-                break
-            except NoSuchElementException:
-                continue
 
-        if not found:                         # no more month sections
-            break
+# Collects every raw field of every card passed in, in one WebDriver round-trip.
+# arguments: [array of card elements, _CTA_XPATH]; a card that throws maps to null
+_PARSE_CARDS_JS = r"""
+const cards = arguments[0], ctaXPath = arguments[1];
+const parseCard = (card) => {
+    const node = (xp) => document.evaluate(
+        xp, card, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    const text = (n) => n ? n.innerText.trim() : null;
+    const t = (xp) => text(node(xp));
+
+    // 1. Expand (headless-safe)
+    const toggle = node('.//div[@role="button" and .="Open Drop-down"]');
+    if (toggle) { try { toggle.click(); } catch (e) {} }
+
+    // 2. Meta fields: one pass over the card's spans, matched on their own text
+    let status = null, libRaw = null, started = null;
+    for (const span of card.querySelectorAll('span')) {
+        const own = Array.from(span.childNodes)
+            .filter(n => n.nodeType === Node.TEXT_NODE).map(n => n.data).join('');
+        if (status === null && (own.includes('Active') || own.includes('Inactive'))) status = text(span);
+        else if (libRaw === null && own.includes('Library ID')) libRaw = text(span);
+        else if (started === null && own.includes('Started running')) started = text(span);
+    }
+
+    // 4a. CTA: first footer button/span whose text is a CTA phrase
+    const cta = t(ctaXPath);
 
-        prefixes.append(found)
-        m += 1
+    return {
+        status:  status,
+        lib_raw: libRaw,
+        started: started,
+        page:    text(card.querySelector('a[href^="https://www.facebook.com/"]')),
+        raw:     (card.innerText || '').trim(),
+        cta:     cta,
+        anchors: Array.from(card.querySelectorAll('a'))
+                      // SVG <a>.href is an SVGAnimatedString, not a string
+                      .map(a => ({href: (typeof a.href === 'string' ? a.href : a.getAttribute('href')) || '',
+                                  text: (a.innerText || '').trim()})),
+        images:  Array.from(card.querySelectorAll('img'))
+                      .map(i => [i.src, i.getAttribute('data-src'), i.getAttribute('xlink:href')]
+                           .find(src => src && /^https?:/.test(src)) || null)
+                      .filter(Boolean),
+    };
+};
+return cards.map(card => { try { return parseCard(card); } catch (e) { return null; } });
+"""
 
-    return prefixes
+_FACEBOOK_DOMAINS = frozenset({"facebook.com", "fb.com", "facebookw.com", "fb.me", "fb.watch"})
 
 
-def _count_cards_in_prefix(prefix: str, sb, gap: int = GAP_LIMIT) -> int:
-    """Count cards in one strip, tolerant of ≤ gap missing indices."""
-    total = misses = idx = 0
-    while misses < gap:
-        idx += 1
-        try:
-            sb.driver.find_element("xpath", f"{prefix}/div[{idx}]/div")
-            total += 1
-            misses = 0
-        except NoSuchElementException:
-            misses += 1
-    return total
+def _link_host(href: str) -> str:
+    """Host part of an absolute URL without a leading "www." (cheaper than urlparse)."""
+    start = href.find("//")
+    if start < 0:
+        return ""
+    host = href[start + 2:]
+    for sep in "/?#":
+        end = host.find(sep)
+        if end >= 0:
+            host = host[:end]
+    return host[4:] if host.startswith("www.") else host
 
 
-def _parse_card(card) -> Dict[str, Any]:
+def _parse_cards(driver, cards: list) -> list[Dict[str, Any] | None]:
     """
-    Parse a single Ad-Library card with enhanced link extraction.
-    """
-    import re
-    from urllib.parse import urlparse
+    Parse a batch of Ad-Library cards with a single execute_script call.
 
-    def _maybe_click(xp: str):
+    Returns one record per card, in order; None where the card couldn't be read.
+    """
+    if not cards:
+        return []
+    raws = driver.execute_script(_PARSE_CARDS_JS, list(cards), _CTA_XPATH) or []
+    records = []
+    for raw in raws:
+        # One odd card must not cost the rest of the batch
         try:
-            card.find_element("xpath", xp).click()
-        except NoSuchElementException:
-            pass
+            records.append(_build_card_record(raw) if raw else None)
+        except Exception as e:
+            logger.debug("Could not build card record: %s", e)
+            records.append(None)
+    return records
 
-    def _t(xp: str) -> str | None:
-        try:
-            return card.find_element("xpath", xp).text.strip()
-        except NoSuchElementException:
-            return None
 
-    # ── 1. Expand (headless-safe) ───────────────────────────────────────
-    _maybe_click('.//div[@role="button" and .="Open Drop-down"]')
+def _build_card_record(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Turn the raw fields read in the browser into an ad record.
 
-    # ── 2. Meta fields ─────────────────────────────────────────────────
-    status       = _t('.//span[contains(text(),"Active") or contains(text(),"Inactive")]')
-    lib_raw      = _t('.//span[contains(text(),"Library ID")]')
-    library_id   = lib_raw.split(":",1)[-1].strip() if lib_raw else None
-    started_raw  = _t('.//span[contains(text(),"Started running")]')
-    page_name    = _t('.//a[starts-with(@href,"https://www.facebook.com/")][1]')
+    Text post-processing (primary text, CTA fallback, link filtering)
+    stays in Python.
+    """
+    lib_raw    = raw.get("lib_raw")
+    library_id = lib_raw.split(":",1)[-1].strip() if lib_raw else None
 
     # ── 3. Raw creative block text ────────────────────────────────────
-    raw_block = card.text.strip()
-    # print(f"[DEBUG] Raw block text: {raw_block}")
+    raw_block = raw.get("raw") or ""
+    # logger.debug(f"Raw block text: {raw_block}")
     #   PRIMARY TEXT extraction
     primary_text = ""
     if "Sponsored" in raw_block:
         after = raw_block.split("Sponsored", 1)[1].lstrip()
         lines = []
         for ln in after.splitlines():
-            if re.match(r"https?://|^[A-Z0-9._%+-]+\.[A-Z]{2,}$", ln, flags=re.I):
+            if _LINK_LINE_RE.match(ln):
                 break
-            if re.match(r"^\w.*\b(Shop|Learn|Contact|Apply|Sign)\b", ln) and len(ln) < 40:
+            if len(ln) < 40 and _CTA_LINE_RE.match(ln):
                 break
             lines.append(ln.rstrip())
         primary_text = "\n".join(lines).strip()
 
     # ── 4. CTA detection ───────────────────────────────────────────────
-    CTA_PHRASES = (
-        "\nLearn More", "\nLearn more", "\nShop Now", "\nShop now", "\nBook Now",
-        "\nBook now", "\nDonate", "\nDonate now", "\nApply Now", "\nApply now",
-        "\nGet offer", "\nGet Offer", "\nGet quote", "\nSign Up", "\nSign up",
-        "\nContact us", "\nSend message", "\nSend Message", "\nSubscribe", "\nRead more","\nSend WhatsApp message",
-        "\nSend WhatsApp Message", "\nWatch video", "\nWatch Video",
-    )
-
-    # (a) DOM: any footer button/span whose text is in CTA_WORDS
-    cta = None
-    for phrase in CTA_PHRASES:
-        label = _t(f'.//div[@role="button" and normalize-space(text())="{phrase}"]'
-                   f' | .//span[normalize-space(text())="{phrase}"]')
-        if label:
-            cta = phrase
-            break
+    # (a) DOM match comes back from the script
+    cta = raw.get("cta")
 
     # (b) fallback: look for the first CTA_PHRASE inside raw_block
     if not cta:
-        m = re.search(r"\b(" + "|".join(map(re.escape, CTA_PHRASES)) + r")\b", raw_block)
+        m = _CTA_RE.search(raw_block)
         cta = m.group(1) if m else None
 
     # ── 5. Enhanced Link Extraction ───────────────────────────────────
-    facebook_domains = {"facebook.com", "fb.com", "facebookw.com", "fb.me", "fb.watch"}
-    all_links = []
-    image_urls = []
-
-    # Extract all <a> tags and <img> tags
-    for element in card.find_elements("xpath", ".//*[self::a or self::img]"):
-        try:
-            if element.tag_name == "a":
-                href = element.get_attribute("href")
-                if href:
-                    parsed = urlparse(href)
-                    if parsed.netloc.replace("www.", "") not in facebook_domains:
-                        all_links.append({
-                            "type": "link",
-                            "url": href,
-                            "text": element.text.strip() if element.text else ""
-                        })
-
-            elif element.tag_name == "img":
-                for attr in ["src", "data-src", "xlink:href"]:
-                    src = element.get_attribute(attr)
-                    if src and src.startswith(("http:", "https:")):
-                        image_urls.append(src)
-                        break
-        except StaleElementReferenceException:
-            continue
+    all_links = [
+        {"type": "link", "url": a["href"], "text": a.get("text") or ""}
+        for a in raw.get("anchors") or []
+        if a.get("href") and _link_host(a["href"]) not in _FACEBOOK_DOMAINS
+    ]
+    image_urls = list(raw.get("images") or [])
 
     # ── 6. Build record ───────────────────────────────────────────────
     return {
-        "status": status,
+        "status": raw.get("status"),
         "library_id": library_id,
-        "started": started_raw,
-        "page": page_name,
+        "started": raw.get("started"),
+        "page": raw.get("page"),
         "primary_text": primary_text,
         "cta": cta,
         "links": all_links,          # All non-Facebook links
         "image_urls": image_urls,     # All image URLs
         # "raw_text": raw_block,
     }
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    # Export Results/suggestions.jsonl into Results/suggestions.json
+    flush_to_json()